@@ -1,16 +1,36 @@
+import os
+import runpy
 import turtle
 import math
+from functools import lru_cache
 
-# Set up the screen
-screen = turtle.Screen()
-screen.bgcolor("white")
-screen.title("Bezier Curve")
-screen.setup(width=800, height=600)
-screen.setworldcoordinates(0, 0, 500, 300)
-# Create a turtle
-pen = turtle.Turtle()
-pen.speed(5)
-pen.pensize(3)
+import numpy as np
+from canvas import TurtleCanvas
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+line_spans = runpy.run_path(os.path.join(HERE, "bresenham line drawing.py"))["line_spans"]
+
+# The screen and pen are created by setup_screen(), so the curve maths can
+# be used without a display
+screen = None
+pen = None
+
+# Where pixels go: the turtle window by default, or a canvas.Framebuffer
+# for headless rendering
+canvas = TurtleCanvas(turtle, dot_size=1)
+
+def setup_screen():
+    """Set up the screen and the drawing turtle"""
+    global screen, pen
+    screen = turtle.Screen()
+    screen.bgcolor("white")
+    screen.title("Bezier Curve")
+    screen.setup(width=800, height=600)
+    screen.setworldcoordinates(0, 0, 500, 300)
+    # Create a turtle
+    pen = turtle.Turtle()
+    pen.speed(5)
+    pen.pensize(3)
 
 def factorial(n):
     """Calculate factorial of n"""
@@ -26,6 +46,213 @@ def bezier_function(k, n, u):
     """Calculate Bezier basis function"""
     return nCr(n, k) * pow(u, k) * pow((1 - u), (n - k))
 
+def bernstein_at(n, u):
+    """Bernstein basis of degree n at arbitrary parameters u, shape (len(u), n + 1)"""
+    u = np.asarray(u, dtype=np.float64)[:, None]
+    k = np.arange(n + 1)
+    binomials = np.array([math.comb(n, r) for r in range(n + 1)], dtype=np.float64)
+    return binomials * u ** k * (1 - u) ** (n - k)
+
+@lru_cache(maxsize=64)
+def bernstein_matrix(n, samples=101):
+    """Bernstein basis of degree n at `samples` evenly spaced u in [0, 1]
+
+    Row i holds bezier_function(k, n, u_i) for k = 0..n, so the points of
+    a curve are this matrix times its (n + 1, 2) control points. Computed
+    once per (degree, samples) with exact binomials and cached (read-only).
+    """
+    basis = bernstein_at(n, np.linspace(0.0, 1.0, samples))
+    basis.flags.writeable = False
+    return basis
+
+def bezier_points(points, samples=101):
+    """Return (samples, 2) points of the Bezier curve with the given control points"""
+    points = np.asarray(points, dtype=np.float64)
+    return bernstein_matrix(len(points) - 1, samples) @ points
+
+def bezier_points_batch(curves, samples=101):
+    """Evaluate a (C, n + 1, 2) stack of same-degree curves with one matrix multiply
+
+    Returns a (C, samples, 2) array.
+    """
+    curves = np.asarray(curves, dtype=np.float64)
+    return bernstein_matrix(curves.shape[1] - 1, samples) @ curves
+
+def de_casteljau_split(points, t=0.5):
+    """Split a Bezier curve at parameter t with de Casteljau's algorithm
+
+    Returns the control points of the two halves. Only repeated linear
+    interpolation is used, so it stays accurate at any degree.
+    """
+    level = np.asarray(points, dtype=np.float64)
+    left = [level[0]]
+    right = [level[-1]]
+    while len(level) > 1:
+        level = (1 - t) * level[:-1] + t * level[1:]
+        left.append(level[0])
+        right.append(level[-1])
+    return np.array(left), np.array(right[::-1])
+
+def flatness(points):
+    """Largest distance of the control points from the chord P0-Pn
+
+    The curve lies in the convex hull of its control points, so this
+    bounds how far the curve strays from the straight chord.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    a = points[0]
+    chord = points[-1] - a
+    length2 = chord @ chord
+    rel = points[1:-1] - a
+    if length2 == 0:
+        t = np.zeros(len(rel))
+    else:
+        t = np.clip(rel @ chord / length2, 0.0, 1.0)
+    gap = rel - t[:, None] * chord
+    return float(np.sqrt(np.max(np.sum(gap * gap, axis=1)))) if len(gap) else 0.0
+
+def flatten_bezier(points, tolerance=0.25, max_depth=24):
+    """Adaptively flatten a Bezier curve into a polyline
+
+    The curve is halved with de Casteljau subdivision until every piece is
+    within `tolerance` (in device units) of its chord, and the chords form
+    the returned (K, 2) polyline from P0 to Pn. Short, nearly straight
+    curves need few points and long, tight ones get as many as they need.
+    """
+    pieces = [(np.asarray(points, dtype=np.float64), 0)]
+    polyline = [pieces[0][0][0]]
+    while pieces:
+        piece, depth = pieces.pop()
+        if depth >= max_depth or flatness(piece) <= tolerance:
+            polyline.append(piece[-1])
+            continue
+        left, right = de_casteljau_split(piece)
+        # Push the right half first so the left half is emitted first
+        pieces.append((right, depth + 1))
+        pieces.append((left, depth + 1))
+    return np.array(polyline)
+
+class BezierPath:
+    """A path made of Bezier segments, with an arc-length index
+
+    Each segment is sampled once (samples per segment) and the cumulative
+    chord length over all samples is kept in one sorted table, so a point
+    or tangent at a given distance along the path is found by binary
+    search in O(log n) plus one Bezier evaluation. Segments may have
+    different degrees.
+    """
+
+    def __init__(self, segments, samples=64):
+        self.segments = [np.asarray(seg, dtype=np.float64) for seg in segments]
+        if not self.segments:
+            raise ValueError("a path needs at least one segment")
+        self.degrees = np.array([len(seg) - 1 for seg in self.segments])
+        # Control points stacked per degree, and each segment's row in its stack
+        self.stacks = {}
+        self.rows = np.empty(len(self.segments), dtype=np.int64)
+        for n in np.unique(self.degrees).tolist():
+            ids = np.flatnonzero(self.degrees == n)
+            self.stacks[n] = np.stack([self.segments[i] for i in ids.tolist()])
+            self.rows[ids] = np.arange(len(ids))
+
+        lengths = [np.zeros(1)]
+        seg_ids = [np.zeros(1, dtype=np.int64)]
+        params = [np.zeros(1)]
+        u = np.linspace(0.0, 1.0, samples)
+        total = 0.0
+        for i, seg in enumerate(self.segments):
+            points = bezier_points(seg, samples)
+            chords = np.cumsum(np.hypot(*np.diff(points, axis=0).T))
+            lengths.append(total + chords)
+            seg_ids.append(np.full(samples - 1, i))
+            params.append(u[1:])
+            total += chords[-1]
+        # Sample j ends the chord (j - 1, j) of segment seg_ids[j]
+        self.lengths = np.concatenate(lengths)
+        self.seg_ids = np.concatenate(seg_ids)
+        self.params = np.concatenate(params)
+        self.length = total
+
+    def locate(self, distances):
+        """Map distances along the path to (segment ids, parameters u)"""
+        d = np.clip(np.asarray(distances, dtype=np.float64).ravel(), 0.0, self.length)
+        j = np.clip(np.searchsorted(self.lengths, d, side="right"), 1, len(self.lengths) - 1)
+        seg = self.seg_ids[j]
+        # The chord's start is u = 0 of this segment when it is the first one
+        u0 = np.where(self.seg_ids[j - 1] == seg, self.params[j - 1], 0.0)
+        span = self.lengths[j] - self.lengths[j - 1]
+        frac = np.divide(d - self.lengths[j - 1], span, out=np.zeros_like(d), where=span > 0)
+        return seg, u0 + (self.params[j] - u0) * frac
+
+    def _evaluate(self, distances, derivative):
+        seg, u = self.locate(distances)
+        out = np.empty((len(seg), 2))
+        for n in np.unique(self.degrees[seg]).tolist():
+            mask = self.degrees[seg] == n
+            controls = self.stacks[n][self.rows[seg[mask]]]
+            if derivative:
+                # B'(u) = n * sum of B_{k,n-1}(u) * (P_{k+1} - P_k)
+                controls = n * np.diff(controls, axis=1)
+                basis = bernstein_at(n - 1, u[mask])
+            else:
+                basis = bernstein_at(n, u[mask])
+            out[mask] = np.einsum("qk,qkd->qd", basis, controls)
+        return out
+
+    def point_at(self, distances):
+        """(N, 2) points at the given distances along the path"""
+        return self._evaluate(distances, derivative=False)
+
+    def tangent_at(self, distances):
+        """(N, 2) unit tangents at the given distances along the path"""
+        tangents = self._evaluate(distances, derivative=True)
+        norms = np.hypot(tangents[:, 0], tangents[:, 1])[:, None]
+        return np.divide(tangents, norms, out=np.zeros_like(tangents), where=norms > 0)
+
+class EditableBezier:
+    """A sampled Bezier curve that updates incrementally when edited
+
+    Each control point contributes to the samples through its own column
+    of the Bernstein matrix, so moving one point is a rank-1 update of the
+    stored samples instead of a full re-evaluation.
+    """
+
+    def __init__(self, points, samples=101):
+        self.points = np.array(points, dtype=np.float64)
+        self.basis = bernstein_matrix(len(self.points) - 1, samples)
+        self.curve = self.basis @ self.points
+
+    def move_point(self, k, x, y, threshold=0.0):
+        """Move control point k to (x, y) and update the samples in place
+
+        Returns the dirty bounding box (xmin, ymin, xmax, ymax) covering the
+        old and new positions of every sample that moved by more than
+        threshold (in device units) and of its two neighbours, so that every
+        polyline segment touching a moved sample is inside it; or None if
+        no sample moved.
+        """
+        delta = np.array([x, y], dtype=np.float64) - self.points[k]
+        self.points[k] = (x, y)
+        shift = self.basis[:, k:k + 1] * delta
+        moved = np.hypot(shift[:, 0], shift[:, 1]) > threshold
+        if not moved.any():
+            self.curve += shift
+            return None
+        # Segments joining a moved sample to a fixed one change as well
+        touched = moved.copy()
+        touched[1:] |= moved[:-1]
+        touched[:-1] |= moved[1:]
+        moved = touched
+        before = self.curve[moved]
+        self.curve += shift
+        after = self.curve[moved]
+        corners = np.concatenate((before, after))
+        return tuple(np.concatenate((corners.min(axis=0), corners.max(axis=0))).tolist())
+
+    def refresh(self):
+        """Recompute all samples, dropping rounding error from many edits"""
+        self.curve = self.basis @ self.points
+
 def draw_point(x, y, color="white", radius=5):
     """Draw a point (circle) at given coordinates"""
     pen.penup()
@@ -39,42 +266,46 @@ def draw_point(x, y, color="white", radius=5):
 
 def put_pixel(x, y, color="black"):
     """Simulate putpixel by drawing a very small dot"""
-    pen.penup()
-    pen.goto(x, y)
-    pen.pendown()
-    pen.color(color)
-    pen.dot(1)
+    canvas.put_pixel(x, y, color)
+
+def draw_polyline_pixels(points, fb=None, color="black"):
+    """Rasterize a polyline with Bresenham spans into fb (default: the module canvas)"""
+    ends = np.rint(np.asarray(points, dtype=np.float64)).astype(np.int64)
+    segments = np.column_stack((ends[:-1], ends[1:]))
+    (fb if fb is not None else canvas).fill_spans(line_spans(segments), color)
 
-def bezier_curve(points):
-    """Draw Bezier curve using given control points"""
-    n = len(points) - 1
+def bezier_curve(points, tolerance=None, fb=None):
+    """Draw Bezier curve using given control points
+
+    With a tolerance the curve is flattened adaptively (flatten_bezier)
+    instead of sampled at a fixed step. With a canvas fb (e.g. a
+    canvas.Framebuffer) the curve, control polygon and control points are
+    rasterized into it instead of drawn by the pen.
+    """
     eps = 0.01  # Slightly larger step for better performance
-    
+
+    if tolerance is not None:
+        curve = flatten_bezier(points, tolerance)
+    else:
+        # Calculate the points on the curve (cached basis, one matrix multiply)
+        curve = bezier_points(points, int(1/eps) + 1)
+
+    if fb is not None:
+        draw_polyline_pixels(points, fb, "black")
+        draw_polyline_pixels(curve, fb, "blue")
+        # Control points as 5x5 pixel squares
+        dx, dy = np.meshgrid(np.arange(-2, 3), np.arange(-2, 3))
+        for x, y in points:
+            fb.put_pixels((x + dx).ravel(), (y + dy).ravel(), "red")
+        return
+
     # Draw the Bezier curve
     pen.color("blue")
-    first_point = True
-    
-    for u in [i * eps for i in range(int(1/eps) + 1)]:
-        if u > 1:
-            u = 1
-            
-        x = 0
-        y = 0
-        
-        # Calculate point on curve
-        for k in range(n + 1):
-            bez = bezier_function(k, n, u)
-            x += points[k][0] * bez
-            y += points[k][1] * bez
-        
-        # Draw the curve
-        if first_point:
-            pen.penup()
-            pen.goto(x, y)
-            pen.pendown()
-            first_point = False
-        else:
-            pen.goto(x, y)
+    pen.penup()
+    pen.goto(*curve[0])
+    pen.pendown()
+    for x, y in curve[1:].tolist():
+        pen.goto(x, y)
     
     # Draw control points
     for i, point in enumerate(points):
@@ -97,6 +328,8 @@ def bezier_curve(points):
         pen.goto(points[i][0], points[i][1])
 
 def main():
+    setup_screen()
+
     # Control points for the Bezier curve
     points = [(27, 243), (101, 47), (324, 197), (437, 23)]
     
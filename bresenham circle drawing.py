@@ -1,61 +1,139 @@
 import turtle
+from functools import lru_cache
 
-# Function to plot symmetric points in all 8 octants
-def plot_circle_points(xc, yc, x, y):
-    turtle.penup()
-    turtle.goto(xc + x, yc + y)
-    turtle.pendown()
-    turtle.dot(3, "blue")
-
-    turtle.penup()
-    turtle.goto(xc - x, yc + y)
-    turtle.pendown()
-    turtle.dot(3, "blue")
-
-    turtle.penup()
-    turtle.goto(xc + x, yc - y)
-    turtle.pendown()
-    turtle.dot(3, "blue")
-
-    turtle.penup()
-    turtle.goto(xc - x, yc - y)
-    turtle.pendown()
-    turtle.dot(3, "blue")
-
-    turtle.penup()
-    turtle.goto(xc + y, yc + x)
-    turtle.pendown()
-    turtle.dot(3, "blue")
-
-    turtle.penup()
-    turtle.goto(xc - y, yc + x)
-    turtle.pendown()
-    turtle.dot(3, "blue")
-
-    turtle.penup()
-    turtle.goto(xc + y, yc - x)
-    turtle.pendown()
-    turtle.dot(3, "blue")
-
-    turtle.penup()
-    turtle.goto(xc - y, yc - x)
-    turtle.pendown()
-    turtle.dot(3, "blue")
+import numpy as np
+from canvas import TurtleCanvas, pixel_spans
+
+# Where pixels go: the turtle window by default, or a canvas.Framebuffer
+# for headless rendering
+canvas = TurtleCanvas(turtle, dot_size=3)
 
 # Bresenham’s Circle Drawing Algorithm
-def drawCircle(xc, yc, r):
+def drawCircle(xc, yc, r, spans=False):
+    if spans:  # Emit horizontal runs instead of single pixels
+        canvas.fill_spans(circle_spans(xc, yc, r), "blue")
+        return
+
+    offsets = circle_offsets(r)
+    canvas.put_pixels(offsets[:, 0] + xc, offsets[:, 1] + yc, "blue")
+
+def octant_points(r):
+    """Return the (x, y) arrays of the decision-variable loop in the first octant"""
+    xs, ys = [], []
     x = 0
     y = r
     p = 3 - 2 * r
 
     while x <= y:
-        plot_circle_points(xc, yc, x, y)
+        xs.append(x)
+        ys.append(y)
         if p < 0:
             p += 4 * x + 6
         else:
             p += 4 * (x - y) + 10
             y -= 1
         x += 1
+    return np.array(xs, dtype=np.int64), np.array(ys, dtype=np.int64)
+
+@lru_cache(maxsize=256)
+def circle_offsets(r):
+    """Return the (K, 2) pixel offsets of a radius r circle around its centre
+
+    The first octant is mirrored into all 8 octants and the pixels shared
+    where octants meet (x == y, x == 0) are dropped, so every pixel appears
+    once. Rows are sorted by y, then x. Results are cached per radius, so
+    the array is read-only.
+    """
+    x, y = octant_points(r)
+    px = np.concatenate((x, -x, x, -x, y, -y, y, -y))
+    py = np.concatenate((y, y, -y, -y, x, x, -x, -x))
+    order = np.lexsort((px, py))
+    px, py = px[order], py[order]
+    keep = np.ones(len(px), dtype=bool)
+    keep[1:] = (px[1:] != px[:-1]) | (py[1:] != py[:-1])
+    offsets = np.column_stack((px[keep], py[keep]))
+    offsets.flags.writeable = False
+    return offsets
+
+def circle_spans(xc, yc, r):
+    """Return the circle outline as (y, x_start, x_end) spans
+
+    The flat top and bottom of the circle become long runs, so large radii
+    need far fewer backend calls than plotting every pixel.
+    """
+    offsets = circle_offsets(r)
+    return pixel_spans(offsets[:, 0] + xc, offsets[:, 1] + yc)
+
+@lru_cache(maxsize=256)
+def row_extents(r):
+    """Return a (2r + 1, 2) array of the outline's (min |x|, max |x|) on rows -r..r
+
+    The outline of drawCircle is 8-connected, so every row from -r to r
+    holds at least one pixel and the pixels on each side form one run.
+    """
+    offsets = circle_offsets(r)
+    rows = offsets[:, 1] + r
+    ax = np.abs(offsets[:, 0])
+    extents = np.empty((2 * r + 1, 2), dtype=np.int64)
+    extents[:, 0] = ax.max()
+    extents[:, 1] = 0
+    np.minimum.at(extents[:, 0], rows, ax)
+    np.maximum.at(extents[:, 1], rows, ax)
+    extents.flags.writeable = False
+    return extents
+
+def disk_spans(xc, yc, r):
+    """Return the filled disk of radius r as one (y, x_start, x_end) span per row"""
+    half = row_extents(r)[:, 1]
+    ys = np.arange(-r, r + 1) + yc
+    return np.column_stack((ys, xc - half, xc + half)).astype(np.int32)
+
+def ring_spans(xc, yc, r_inner, r_outer):
+    """Return the annulus between two radii as (y, x_start, x_end) spans
+
+    Both outlines belong to the ring, so ring_spans(xc, yc, r, r) is exactly
+    the drawCircle outline. Rows that cross the hole give two spans.
+    """
+    if r_inner > r_outer:
+        raise ValueError(f"inner radius {r_inner} is larger than outer radius {r_outer}")
+    outer = row_extents(r_outer)[:, 1]
+    dy = np.arange(-r_outer, r_outer + 1)
+    # Pixels with |x| < hole are strictly inside the inner outline
+    hole = np.zeros(len(dy), dtype=np.int64)
+    inner_rows = np.abs(dy) <= r_inner
+    hole[inner_rows] = row_extents(r_inner)[dy[inner_rows] + r_inner, 0]
+
+    split = hole > 0
+    whole = np.column_stack((dy[~split], -outer[~split], outer[~split]))
+    left = np.column_stack((dy[split], -outer[split], -hole[split]))
+    right = np.column_stack((dy[split], hole[split], outer[split]))
+    spans = np.concatenate((whole, left, right))
+    spans = spans[np.lexsort((spans[:, 1], spans[:, 0]))]
+    return (spans + (yc, xc, xc)).astype(np.int32)
+
+def fill_disk(xc, yc, r, fb=None, color="blue"):
+    """Fill a disk scanline by scanline into fb (default: the module canvas)"""
+    (fb if fb is not None else canvas).fill_spans(disk_spans(xc, yc, r), color)
+
+def fill_ring(xc, yc, r_inner, r_outer, fb=None, color="blue"):
+    """Fill an annulus scanline by scanline into fb (default: the module canvas)"""
+    target = fb if fb is not None else canvas
+    target.fill_spans(ring_spans(xc, yc, r_inner, r_outer), color)
+
+def draw_circles(centers, radii, fb=None, color="blue"):
+    """Draw many circles at once into fb (default: the module canvas)
+
+    centers is an (N, 2) integer array and radii a single radius or one
+    per centre. Each distinct radius is rasterized once (cached) and its
+    offsets are stamped at all of its centres by broadcasting.
+    """
+    centers = np.asarray(centers, dtype=np.int64).reshape(-1, 2)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.int64), len(centers))
+    target = fb if fb is not None else canvas
+    for r in np.unique(radii).tolist():
+        offsets = circle_offsets(r)
+        points = centers[radii == r, None, :] + offsets[None, :, :]
+        target.put_pixels(points[..., 0].ravel(), points[..., 1].ravel(), color)
 
 def main():
     turtle.speed(0)
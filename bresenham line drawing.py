@@ -1,14 +1,26 @@
 import turtle
+import numpy as np
+from canvas import TurtleCanvas, pixel_spans
+
+# Where pixels go: the turtle window by default (3px dot simulates a pixel),
+# or a canvas.Framebuffer for headless rendering
+canvas = TurtleCanvas(turtle, dot_size=3)
 
 # Function to draw a pixel (dot)
 def putpixel(x, y, color="black"):
-    turtle.penup()
-    turtle.goto(x, y)
-    turtle.pendown()
-    turtle.dot(3, color)   # 3px dot simulates a pixel
+    canvas.put_pixel(x, y, color)
+
+# Bresenham's Line Drawing Algorithm (all octants)
+def drawLine(x1, y1, x2, y2, spans=False):
+    if spans:  # Emit horizontal runs instead of single pixels
+        canvas.fill_spans(line_spans([(x1, y1, x2, y2)]))
+        return
+
+    steep = abs(y2 - y1) > abs(x2 - x1)
+    if steep:  # |slope| > 1: step along y instead of x
+        x1, y1 = y1, x1
+        x2, y2 = y2, x2
 
-# Bresenham's Line Drawing Algorithm
-def drawLine(x1, y1, x2, y2):
     if x1 > x2:  # Ensure left-to-right drawing
         x1, x2 = x2, x1
         y1, y2 = y2, y1
@@ -20,13 +32,95 @@ def drawLine(x1, y1, x2, y2):
     y_step = 1 if y1 < y2 else -1
 
     for x in range(x1, x2 + 1):
-        putpixel(x, y)
+        if steep:
+            putpixel(y, x)
+        else:
+            putpixel(x, y)
         if p >= 0:
             y += y_step
             p += 2 * (dy - dx)
         else:
             p += 2 * dy
 
+# Batch version of drawLine: all pixels of many segments in one NumPy pass
+def line_pixels(segments):
+    """Return (xs, ys) of the Bresenham pixels of an (N, 4) array of segments
+
+    Each row is (x1, y1, x2, y2) in integer pixel coordinates, in any
+    octant. The pixels are exactly those drawLine plots, grouped by segment
+    in drawing order.
+    """
+    seg = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    x1, y1, x2, y2 = seg.T
+
+    # Step along the major axis (a) and track the minor axis (b)
+    steep = np.abs(y2 - y1) > np.abs(x2 - x1)
+    a1 = np.where(steep, y1, x1)
+    b1 = np.where(steep, x1, y1)
+    a2 = np.where(steep, y2, x2)
+    b2 = np.where(steep, x2, y2)
+
+    # Ensure the major axis increases, as drawLine does
+    swap = a1 > a2
+    a1, a2 = np.where(swap, a2, a1), np.where(swap, a1, a2)
+    b1, b2 = np.where(swap, b2, b1), np.where(swap, b1, b2)
+
+    da = a2 - a1
+    db = np.abs(b2 - b1)
+    b_step = np.where(b2 >= b1, 1, -1)
+
+    # One entry per pixel: its segment and its step index along the segment
+    counts = da + 1
+    ids = np.repeat(np.arange(len(seg)), counts)
+    starts = np.cumsum(counts) - counts
+    i = np.arange(len(ids)) - starts[ids]
+
+    # The decision variable p >= 0 in closed form: the minor offset after
+    # i steps is round(i * db / da) with ties moving away from the start
+    da, db = da[ids], db[ids]
+    offset = (2 * db * i + da) // np.maximum(2 * da, 1)
+
+    a = a1[ids] + i
+    b = b1[ids] + b_step[ids] * offset
+    steep = steep[ids]
+    return np.where(steep, b, a), np.where(steep, a, b)
+
+def line_spans(segments):
+    """Return the pixels of an (N, 4) array of segments as (y, x_start, x_end) spans
+
+    Shallow lines collapse into a few long runs; steep lines give one
+    single-pixel span per row.
+    """
+    return pixel_spans(*line_pixels(segments))
+
+def segment_chunks(segments, max_pixels=1 << 20):
+    """Split an (N, 4) array of segments into runs of at most max_pixels pixels
+
+    A segment longer than max_pixels makes a run of its own.
+    """
+    seg = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    counts = np.maximum(np.abs(seg[:, 2] - seg[:, 0]), np.abs(seg[:, 3] - seg[:, 1])) + 1
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(seg):
+        done = ends[start - 1] if start else 0
+        stop = max(int(np.searchsorted(ends, done + max_pixels, side="right")), start + 1)
+        yield seg[start:stop]
+        start = stop
+
+def draw_lines(segments, fb=None, color="black", spans=False, max_pixels=1 << 20):
+    """Draw an (N, 4) array of segments into fb (default: the module canvas)
+
+    Segments are rasterized in chunks of about max_pixels pixels, so
+    memory use stays bounded however many segments there are.
+    """
+    target = fb if fb is not None else canvas
+    for chunk in segment_chunks(segments, max_pixels):
+        if spans:
+            target.fill_spans(line_spans(chunk), color)
+        else:
+            target.put_pixels(*line_pixels(chunk), color)
+
 def main():
     turtle.speed(5)     # Fastest
     turtle.hideturtle() # Hide turtle cursor
@@ -0,0 +1,148 @@
+import numpy as np
+
+# Pluggable drawing surfaces shared by the raster scripts.
+#
+# Every canvas offers the same small interface:
+#   put_pixel(x, y, color)          - one pixel
+#   put_pixels(xs, ys, color)       - a batch of pixels
+#   fill_spans(spans, color)        - horizontal runs (y, x_start, x_end)
+# so an algorithm can plot into a turtle window for display, or into an
+# in-memory NumPy framebuffer when there is no display (CI, batch jobs).
+
+# A few named colours used across the lab scripts (same values as Tk)
+COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "cyan": (0, 255, 255),
+    "magenta": (255, 0, 255),
+    "yellow": (255, 255, 0),
+}
+
+
+def to_rgb(color):
+    """Convert a colour name, '#rrggbb' string or (r, g, b) tuple to RGB"""
+    if isinstance(color, str):
+        if color.startswith("#") and len(color) == 7:
+            return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+        try:
+            return COLORS[color.lower()]
+        except KeyError:
+            raise ValueError(f"unknown colour: {color!r}") from None
+    r, g, b = color
+    return (int(r), int(g), int(b))
+
+
+def pixel_spans(xs, ys):
+    """Run-length encode a pixel sequence into horizontal spans
+
+    Consecutive pixels on the same row whose x increases by one are merged
+    into a single (y, x_start, x_end) span, ends inclusive. Returns a (K, 3)
+    int32 array, a compact format that is cheap to cache or send around.
+    """
+    xs = np.asarray(xs, dtype=np.int64)
+    ys = np.asarray(ys, dtype=np.int64)
+    if len(xs) == 0:
+        return np.empty((0, 3), dtype=np.int32)
+    new_run = np.ones(len(xs), dtype=bool)
+    new_run[1:] = (ys[1:] != ys[:-1]) | (xs[1:] != xs[:-1] + 1)
+    starts = np.flatnonzero(new_run)
+    ends = np.append(starts[1:], len(xs)) - 1
+    return np.column_stack((ys[starts], xs[starts], xs[ends])).astype(np.int32)
+
+
+class Framebuffer:
+    """In-memory uint8 RGB framebuffer
+
+    Pixel (x, y) is stored at pixels[y + origin_y, x + origin_x], so with
+    origin=(width // 2, height // 2) the coordinates match turtle's
+    default screen, where (0, 0) is the centre. Pixels that fall outside
+    the buffer are silently dropped, like a real screen does.
+    """
+
+    def __init__(self, width, height, origin=(0, 0), background="white"):
+        self.width = width
+        self.height = height
+        self.origin = origin
+        self.pixels = np.empty((height, width, 3), dtype=np.uint8)
+        self.clear(background)
+
+    def clear(self, color="white"):
+        """Fill the whole buffer with one colour"""
+        self.pixels[:] = to_rgb(color)
+
+    def put_pixel(self, x, y, color="black"):
+        """Set a single pixel"""
+        col = int(round(x)) + self.origin[0]
+        row = int(round(y)) + self.origin[1]
+        if 0 <= col < self.width and 0 <= row < self.height:
+            self.pixels[row, col] = to_rgb(color)
+
+    def put_pixels(self, xs, ys, color="black"):
+        """Set a batch of pixels given as coordinate arrays"""
+        cols = np.rint(np.asarray(xs)).astype(np.intp) + self.origin[0]
+        rows = np.rint(np.asarray(ys)).astype(np.intp) + self.origin[1]
+        keep = (cols >= 0) & (cols < self.width) & (rows >= 0) & (rows < self.height)
+        self.pixels[rows[keep], cols[keep]] = to_rgb(color)
+
+    def fill_spans(self, spans, color="black"):
+        """Fill (y, x_start, x_end) spans with one fancy-index assignment
+
+        Spans are clipped to the buffer and expanded to flat pixel indices
+        (each span's start repeated over its length plus a running offset).
+        """
+        spans = np.asarray(spans, dtype=np.int64).reshape(-1, 3)
+        rows = spans[:, 0] + self.origin[1]
+        c0 = np.maximum(spans[:, 1] + self.origin[0], 0)
+        c1 = np.minimum(spans[:, 2] + self.origin[0] + 1, self.width)
+        keep = (rows >= 0) & (rows < self.height) & (c0 < c1)
+        rows, c0, c1 = rows[keep], c0[keep], c1[keep]
+        lengths = c1 - c0
+        starts = rows * self.width + c0
+        first = np.cumsum(lengths) - lengths
+        flat = np.repeat(starts - first, lengths) + np.arange(lengths.sum())
+        self.pixels.reshape(-1, 3)[flat] = to_rgb(color)
+
+    def save_ppm(self, path):
+        """Write the buffer as a binary PPM image (+y pointing up)"""
+        with open(path, "wb") as f:
+            f.write(b"P6 %d %d 255\n" % (self.width, self.height))
+            f.write(np.ascontiguousarray(self.pixels[::-1]).tobytes())
+
+
+class TurtleCanvas:
+    """Canvas that plots pixels as turtle dots, for on-screen display
+
+    `pen` can be the turtle module itself or a turtle.Turtle instance.
+    """
+
+    def __init__(self, pen, dot_size=3):
+        self.pen = pen
+        self.dot_size = dot_size
+
+    def put_pixel(self, x, y, color="black"):
+        """Draw a single dot"""
+        self.pen.penup()
+        self.pen.goto(x, y)
+        self.pen.pendown()
+        self.pen.dot(self.dot_size, color)
+
+    def put_pixels(self, xs, ys, color="black"):
+        """Draw a batch of dots"""
+        for x, y in zip(xs, ys):
+            self.put_pixel(float(x), float(y), color)
+
+    def fill_spans(self, spans, color="black"):
+        """Draw each (y, x_start, x_end) span as one horizontal stroke"""
+        self.pen.pensize(self.dot_size)
+        self.pen.pencolor(color)
+        for y, x0, x1 in np.asarray(spans).reshape(-1, 3).tolist():
+            self.pen.penup()
+            self.pen.goto(x0, y)
+            self.pen.pendown()
+            if x1 > x0:
+                self.pen.goto(x1, y)
+            else:
+                self.pen.dot(self.dot_size, color)
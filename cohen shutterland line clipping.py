@@ -1,16 +1,25 @@
 import turtle
 
-# Set up the screen
-screen = turtle.Screen()
-screen.bgcolor("white")
-screen.title("Cohen-Sutherland Line Clipping Algorithm")
-screen.setup(width=800, height=600)
-screen.setworldcoordinates(0, 0, 600, 500)
-
-# Create a turtle
-pen = turtle.Turtle()
-pen.speed(0)
-pen.pensize(5)
+import numpy as np
+
+# The screen and pen are created by setup_screen(), so the clipping
+# functions can be used without a display
+screen = None
+pen = None
+
+def setup_screen():
+    """Set up the screen and the drawing turtle"""
+    global screen, pen
+    screen = turtle.Screen()
+    screen.bgcolor("white")
+    screen.title("Cohen-Sutherland Line Clipping Algorithm")
+    screen.setup(width=800, height=600)
+    screen.setworldcoordinates(0, 0, 600, 500)
+
+    # Create a turtle
+    pen = turtle.Turtle()
+    pen.speed(0)
+    pen.pensize(5)
 
 # Clipping window coordinates
 x_left = 120
@@ -108,7 +117,137 @@ def cohen_sutherland(x1, y1, x2, y2):
                 y2 = y
                 code2 = region_code(x2, y2)
 
+def region_codes(x, y, window):
+    """Calculate the region codes of arrays of points against a window
+
+    window is (x_left, y_bottom, x_right, y_top).
+    """
+    left, bottom, right, top = window
+    codes = np.where(x > right, Right, np.where(x < left, Left, 0))
+    codes |= np.where(y > top, Top, np.where(y < bottom, Bottom, 0))
+    return codes
+
+def cohen_sutherland_batch(segments, window=None):
+    """Cohen-Sutherland clipping of many segments at once
+
+    segments is an (N, 4) array of (x1, y1, x2, y2) rows and window is
+    (x_left, y_bottom, x_right, y_top), by default the module's clipping
+    window. Returns (clipped, accept): an (N, 4) float array of clipped
+    segments and a boolean mask of the segments that are (partly) inside.
+    Rows where accept is False hold no meaningful coordinates.
+
+    Each pass handles trivial accept/reject and moves one outside endpoint
+    onto a window edge for every undecided segment, like one iteration of
+    the loop in cohen_sutherland; at most four passes are needed.
+    """
+    if window is None:
+        window = (x_left, y_bottom, x_right, y_top)
+    left, bottom, right, top = window
+    seg = np.array(segments, dtype=np.float64).reshape(-1, 4)
+    code1 = region_codes(seg[:, 0], seg[:, 1], window)
+    code2 = region_codes(seg[:, 2], seg[:, 3], window)
+    accept = np.zeros(len(seg), dtype=bool)
+
+    active = np.arange(len(seg))
+    while len(active):
+        c1 = code1[active]
+        c2 = code2[active]
+        # Line is completely inside
+        inside = (c1 | c2) == 0
+        accept[active[inside]] = True
+        # Line is completely outside
+        outside = (c1 & c2) != 0
+        undecided = ~(inside | outside)
+        active = active[undecided]
+        if not len(active):
+            break
+
+        # Choose an endpoint that is outside the clipping window
+        c1 = c1[undecided]
+        first = c1 != 0
+        code = np.where(first, c1, code2[active])
+        x1, y1, x2, y2 = seg[active].T
+
+        # Find intersection points, in the same edge order as cohen_sutherland
+        top_hit = (code & Top) != 0
+        bottom_hit = ~top_hit & ((code & Bottom) != 0)
+        vertical = top_hit | bottom_hit
+        left_hit = ~vertical & ((code & Left) != 0)
+        x = np.where(left_hit, left, right).astype(np.float64)
+        y = np.where(top_hit, top, bottom).astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.where(vertical, x1 + (x2 - x1) / (y2 - y1) * (y - y1), x)
+            y = np.where(vertical, y, y1 + (y2 - y1) / (x2 - x1) * (x - x1))
+
+        # Replace the outside endpoints with the intersection points
+        moved = active[first]
+        seg[moved, 0] = x[first]
+        seg[moved, 1] = y[first]
+        code1[moved] = region_codes(x[first], y[first], window)
+        moved = active[~first]
+        seg[moved, 2] = x[~first]
+        seg[moved, 3] = y[~first]
+        code2[moved] = region_codes(x[~first], y[~first], window)
+
+    return seg, accept
+
+def liang_barsky_batch(segments, window=None):
+    """Liang-Barsky parametric clipping of many segments at once
+
+    Same arguments and result as cohen_sutherland_batch. Each segment is
+    written as P(t) = P1 + t * (P2 - P1), and the four window edges narrow
+    the visible parameter range [t0, t1] in a single pass, with no repeated
+    region code computation. Segments parallel to an edge (p == 0) are kept
+    or rejected by the sign of q alone, so axis-parallel and zero-length
+    segments need no division.
+    """
+    if window is None:
+        window = (x_left, y_bottom, x_right, y_top)
+    left, bottom, right, top = window
+    seg = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    x1, y1, x2, y2 = seg.T
+    dx = x2 - x1
+    dy = y2 - y1
+
+    t0 = np.zeros(len(seg))
+    t1 = np.ones(len(seg))
+    accept = np.ones(len(seg), dtype=bool)
+    for p, q in ((-dx, x1 - left), (dx, right - x1),
+                 (-dy, y1 - bottom), (dy, top - y1)):
+        parallel = p == 0
+        accept &= ~(parallel & (q < 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = q / p
+        entering = p < 0
+        leaving = p > 0
+        t0 = np.where(entering, np.maximum(t0, r), t0)
+        t1 = np.where(leaving, np.minimum(t1, r), t1)
+    accept &= t0 <= t1
+
+    clipped = np.column_stack((x1 + t0 * dx, y1 + t0 * dy,
+                               x1 + t1 * dx, y1 + t1 * dy))
+    return clipped, accept
+
+# Batch clipping engines selectable by name in clip_segments
+CLIP_ENGINES = {
+    "cohen-sutherland": cohen_sutherland_batch,
+    "liang-barsky": liang_barsky_batch,
+}
+
+def clip_segments(segments, window=None, engine="cohen-sutherland"):
+    """Clip an (N, 4) array of segments with the chosen engine
+
+    Returns (clipped, accept) as described in cohen_sutherland_batch.
+    """
+    try:
+        clip = CLIP_ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"unknown clipping engine: {engine!r}") from None
+    return clip(segments, window)
+
 def main():
+    setup_screen()
+
     # Draw clipping window in yellow
     draw_rectangle(x_left, y_bottom, x_right, y_top, "green")
     
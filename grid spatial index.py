@@ -0,0 +1,196 @@
+import os
+import runpy
+import time
+
+import numpy as np
+
+# Uniform-grid spatial index over bounding boxes, used to clip many segments
+# and polygons against many viewports. Each viewport only visits the items
+# whose boxes share a grid cell with it, instead of scanning every item.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+line_clipping = runpy.run_path(os.path.join(HERE, "cohen shutterland line clipping.py"))
+polygon_clipping = runpy.run_path(
+    os.path.join(HERE, "shutterland hodgman polygon clipping algorithm.py"))
+clip_segments = line_clipping["clip_segments"]
+sutherland_hodgman_clip = polygon_clipping["sutherland_hodgman_clip"]
+
+def segment_boxes(segments):
+    """Return the (N, 4) bounding boxes (xmin, ymin, xmax, ymax) of segments"""
+    seg = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    return np.column_stack((np.minimum(seg[:, 0], seg[:, 2]),
+                            np.minimum(seg[:, 1], seg[:, 3]),
+                            np.maximum(seg[:, 0], seg[:, 2]),
+                            np.maximum(seg[:, 1], seg[:, 3])))
+
+def polygon_boxes(polygons):
+    """Return the (N, 4) bounding boxes of a list of polygons (lists of (x, y))
+
+    Empty polygons (fully clipped ones) get a NaN box, which never
+    overlaps a window.
+    """
+    boxes = np.full((len(polygons), 4), np.nan)
+    for i, vertices in enumerate(polygons):
+        if len(vertices):
+            xs, ys = zip(*vertices)
+            boxes[i] = (min(xs), min(ys), max(xs), max(ys))
+    return boxes
+
+class GridIndex:
+    """Static uniform grid over axis-aligned bounding boxes
+
+    Every box is registered in each grid cell it overlaps. The cell lists
+    are stored in one sorted array plus per-cell offsets (CSR layout), so
+    building the index and querying it are NumPy operations.
+
+    The grid covers bounds = (x_min, y_min, x_max, y_max), by default the
+    extent of the boxes; pass the area of the query windows so that a few
+    far-away items do not blow up the grid. Boxes entirely outside bounds
+    go to an overflow list that every query also checks, boxes with NaN
+    coordinates are skipped, and the cell size is raised if the grid would
+    need more than max_cells cells.
+    """
+
+    def __init__(self, boxes, cell_size, bounds=None, max_cells=1 << 22):
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        valid = ~np.isnan(self.boxes).any(axis=1)
+        if bounds is None:
+            b = self.boxes[valid]
+            bounds = (*b[:, :2].min(axis=0), *b[:, 2:].max(axis=0)) if len(b) else (0, 0, 0, 0)
+        if not np.isfinite(cell_size) or cell_size <= 0:
+            raise ValueError(f"cell_size must be positive and finite, got {cell_size}")
+        if not np.all(np.isfinite(bounds)):
+            raise ValueError(f"bounds must be finite, got {bounds}")
+        self.origin = np.array(bounds[:2], dtype=np.float64)
+        extent = np.array(bounds[2:], dtype=np.float64) - self.origin
+        self.cell_size = float(cell_size)
+        while np.prod(np.floor(extent / self.cell_size) + 1) > max_cells:
+            self.cell_size *= 2
+        self.shape = np.floor(extent / self.cell_size).astype(np.int64) + 1
+
+        b = self.boxes
+        outside = ((b[:, 2] < bounds[0]) | (b[:, 0] > bounds[2]) |
+                   (b[:, 3] < bounds[1]) | (b[:, 1] > bounds[3]))
+        self.overflow = np.flatnonzero(valid & outside)
+        inside = np.flatnonzero(valid & ~outside)
+
+        # Cell range (inclusive) covered by each box
+        low = self._cells(self.boxes[inside, :2])
+        high = self._cells(self.boxes[inside, 2:])
+        span = high - low + 1
+        counts = span[:, 0] * span[:, 1]
+
+        # One (cell, box) pair per covered cell
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        rows = np.repeat(np.arange(len(inside)), counts)
+        cx = low[rows, 0] + k % span[rows, 0]
+        cy = low[rows, 1] + k // span[rows, 0]
+        cell_ids = cy * self.shape[0] + cx
+
+        order = np.argsort(cell_ids, kind="stable")
+        self.items = inside[rows[order]]
+        cell_counts = np.bincount(cell_ids, minlength=self.shape[0] * self.shape[1])
+        self.offsets = np.concatenate(([0], np.cumsum(cell_counts)))
+
+    def _cells(self, points):
+        """Grid cell (column, row) of points, clamped to the grid"""
+        cells = np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, self.shape - 1)
+
+    def query(self, window):
+        """Return the sorted ids of boxes overlapping window
+
+        window is (x_left, y_bottom, x_right, y_top), like the line clipper.
+        """
+        left, bottom, right, top = window
+        (cx0, cy0), (cx1, cy1) = self._cells(np.array([[left, bottom], [right, top]]))
+        rows = np.arange(cy0, cy1 + 1)
+        starts = self.offsets[rows * self.shape[0] + cx0]
+        ends = self.offsets[rows * self.shape[0] + cx1 + 1]
+        candidates = np.unique(np.concatenate(
+            [self.items[a:b] for a, b in zip(starts.tolist(), ends.tolist())] +
+            [self.overflow]))
+        # Cells are coarse: keep only boxes that really overlap the window
+        b = self.boxes[candidates]
+        overlap = ((b[:, 0] <= right) & (b[:, 2] >= left) &
+                   (b[:, 1] <= top) & (b[:, 3] >= bottom))
+        return candidates[overlap]
+
+def windows_bounds(windows):
+    """The (x_min, y_min, x_max, y_max) area covered by a list of windows"""
+    w = np.asarray(windows, dtype=np.float64).reshape(-1, 4)
+    return (w[:, 0].min(), w[:, 1].min(), w[:, 2].max(), w[:, 3].max())
+
+def default_cell_size(windows):
+    """A cell about the size of an average window"""
+    w = np.asarray(windows, dtype=np.float64).reshape(-1, 4)
+    return max(np.mean(np.maximum(w[:, 2] - w[:, 0], w[:, 3] - w[:, 1])), 1e-9)
+
+def clip_segments_per_window(segments, windows, cell_size=None,
+                             engine="cohen-sutherland"):
+    """Clip an (N, 4) array of segments against each window
+
+    Returns one (ids, clipped) pair per window: the ids of the segments
+    that are visible in it and their clipped coordinates.
+    """
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    index = GridIndex(segment_boxes(segments), cell_size or default_cell_size(windows),
+                      windows_bounds(windows))
+    results = []
+    for window in windows:
+        ids = index.query(window)
+        clipped, accept = clip_segments(segments[ids], window, engine)
+        results.append((ids[accept], clipped[accept]))
+    return results
+
+def clip_polygons_per_window(polygons, windows, cell_size=None):
+    """Clip a list of polygons against each window
+
+    Returns one list of (id, clipped polygon) pairs per window, for the
+    polygons that are visible in it.
+    """
+    index = GridIndex(polygon_boxes(polygons), cell_size or default_cell_size(windows),
+                      windows_bounds(windows))
+    results = []
+    for left, bottom, right, top in windows:
+        window = {'left': left, 'right': right, 'bottom': bottom, 'top': top}
+        clipped = []
+        for i in index.query((left, bottom, right, top)).tolist():
+            polygon = sutherland_hodgman_clip(polygons[i], window)
+            if polygon:
+                clipped.append((i, polygon))
+        results.append(clipped)
+    return results
+
+def tile_windows(width, height, columns, rows):
+    """Split a width x height canvas into columns x rows viewports"""
+    xs = np.linspace(0, width, columns + 1)
+    ys = np.linspace(0, height, rows + 1)
+    return [(xs[i], ys[j], xs[i + 1], ys[j + 1])
+            for j in range(rows) for i in range(columns)]
+
+def main():
+    rng = np.random.default_rng(0)
+    windows = tile_windows(6000, 5000, 20, 20)
+
+    # Short segments scattered over the whole canvas
+    start = rng.uniform(0, [6000, 5000], (200_000, 2))
+    segments = np.hstack((start, start + rng.uniform(-100, 100, start.shape)))
+
+    begin = time.perf_counter()
+    indexed = clip_segments_per_window(segments, windows)
+    indexed_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    for window in windows:
+        clip_segments(segments, window)
+    all_pairs_time = time.perf_counter() - begin
+
+    visible = sum(len(ids) for ids, _ in indexed)
+    print(f"{len(segments)} segments, {len(windows)} viewports, "
+          f"{visible} visible pieces")
+    print(f"grid index: {indexed_time * 1000:.1f} ms, "
+          f"all pairs: {all_pairs_time * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import time
+from collections import deque
+
+import numpy as np
+
+# Keyframe animation of translate / rotate / scale for many objects at once.
+#
+# All keyframes live in padded (objects x keyframes) arrays, so a frame is
+# evaluated for every object in one vectorized pass. Each frame's result is
+# an (objects, 3, 3) stack of homogeneous matrices, equal to
+#   Transform().scale(sx, sy).rotate(angle).translate(tx, ty)
+# from "translation rotation scaling.py" for each object.
+
+EASINGS = ("linear", "ease")
+
+class Timeline:
+    """Keyframed transforms of many objects, with a per-frame time budget
+
+    times is an (O, K) array of keyframe times per object (pad shorter
+    tracks with NaN; each row is sorted here, keyframes in any order are
+    fine), translate and scale are (O, K, 2) and angle (O, K) in
+    degrees. easing is "linear" or "ease" (smoothstep in and out), for all
+    objects or one per object. Angles turn the short way round between
+    keyframes (slerp-style) unless shortest_angle is False.
+
+    Every evaluate() call is timed; running totals cover all frames and
+    the last `history` frame times are kept in frame_ms.
+    """
+
+    def __init__(self, times, translate, angle, scale, easing="linear",
+                 shortest_angle=True, budget_ms=16.0, history=1000):
+        times = np.array(times, dtype=np.float64)
+        if times.ndim != 2 or times.shape[1] == 0:
+            raise ValueError("times must be an (objects, keyframes) array")
+        self.counts = np.sum(~np.isnan(times), axis=1)
+        if np.any(self.counts == 0):
+            raise ValueError("every object needs at least one keyframe")
+        # Sort each object's keyframes by time, NaN padding last
+        order = np.argsort(times, axis=1, kind="stable")
+        times = np.take_along_axis(times, order, axis=1)
+        # Padding never matches a time lookup
+        times[np.isnan(times)] = np.inf
+        self.times = times
+        self.translate = np.take_along_axis(
+            np.asarray(translate, dtype=np.float64), order[:, :, None], axis=1)
+        self.angle = np.take_along_axis(np.asarray(angle, dtype=np.float64), order, axis=1)
+        self.scale = np.take_along_axis(
+            np.asarray(scale, dtype=np.float64), order[:, :, None], axis=1)
+
+        easing = np.broadcast_to(np.asarray(easing), len(times))
+        unknown = set(easing.tolist()) - set(EASINGS)
+        if unknown:
+            raise ValueError(f"unknown easing: {unknown.pop()!r}")
+        self.eased = easing == "ease"
+        self.shortest_angle = shortest_angle
+        self.budget_ms = budget_ms
+        self.frame_ms = deque(maxlen=history)
+        self.frames = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.over_budget = 0
+
+    @classmethod
+    def from_keyframes(cls, tracks, **options):
+        """Build a timeline from per-object lists of keyframe dicts
+
+        Each keyframe is a dict with 'time' and optional 'translate' (tx, ty),
+        'angle' and 'scale' (sx, sy). A channel left out of a keyframe holds
+        its value from the previous keyframe (identity before the first).
+        """
+        objects = len(tracks)
+        keys = max(len(track) for track in tracks)
+        times = np.full((objects, keys), np.nan)
+        translate = np.zeros((objects, keys, 2))
+        angle = np.zeros((objects, keys))
+        scale = np.ones((objects, keys, 2))
+        for i, track in enumerate(tracks):
+            held = {'translate': (0, 0), 'angle': 0, 'scale': (1, 1)}
+            for j, key in enumerate(sorted(track, key=lambda k: k['time'])):
+                held.update((name, key[name]) for name in held if name in key)
+                times[i, j] = key['time']
+                translate[i, j] = held['translate']
+                angle[i, j] = held['angle']
+                scale[i, j] = held['scale']
+        return cls(times, translate, angle, scale, **options)
+
+    def evaluate(self, t):
+        """Return the (O, 3, 3) transform matrices of all objects at time t"""
+        start = time.perf_counter()
+        rows = np.arange(len(self.times))
+        # Keyframe pair around t, clamped to each object's own track
+        i = np.sum(self.times <= t, axis=1) - 1
+        i = np.clip(i, 0, np.maximum(self.counts - 2, 0))
+        j = np.minimum(i + 1, self.counts - 1)
+
+        t0 = self.times[rows, i]
+        t1 = self.times[rows, j]
+        span = t1 - t0
+        u = np.divide(t - t0, span, out=np.ones_like(t0), where=span > 0)
+        u = np.clip(u, 0.0, 1.0)
+        u = np.where(self.eased, u * u * (3 - 2 * u), u)
+
+        translate = self.translate[rows, i] + (self.translate[rows, j] - self.translate[rows, i]) * u[:, None]
+        scale = self.scale[rows, i] + (self.scale[rows, j] - self.scale[rows, i]) * u[:, None]
+        turn = self.angle[rows, j] - self.angle[rows, i]
+        if self.shortest_angle:
+            turn = (turn + 180) % 360 - 180
+        rad = np.radians(self.angle[rows, i] + turn * u)
+
+        c = np.cos(rad)
+        s = np.sin(rad)
+        matrices = np.zeros((len(rows), 3, 3))
+        matrices[:, 0, 0] = c * scale[:, 0]
+        matrices[:, 0, 1] = -s * scale[:, 1]
+        matrices[:, 1, 0] = s * scale[:, 0]
+        matrices[:, 1, 1] = c * scale[:, 1]
+        matrices[:, :2, 2] = translate
+        matrices[:, 2, 2] = 1
+        self.record_frame((time.perf_counter() - start) * 1000)
+        return matrices
+
+    def record_frame(self, ms):
+        """Add one frame time to the running statistics"""
+        self.frame_ms.append(ms)
+        self.frames += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.over_budget += ms > self.budget_ms
+
+    def report(self):
+        """Summary of the frame times measured so far against the budget"""
+        return {
+            'frames': self.frames,
+            'budget_ms': self.budget_ms,
+            'mean_ms': self.total_ms / self.frames if self.frames else 0.0,
+            'max_ms': self.max_ms,
+            'over_budget': self.over_budget,
+        }
+
+def apply_matrices(matrices, geometry):
+    """Transform one (N, 2) shape by each of (O, 3, 3) matrices -> (O, N, 2)"""
+    geometry = np.asarray(geometry, dtype=np.float64).reshape(-1, 2)
+    return np.einsum("oij,nj->oni", matrices[:, :2, :2], geometry) + matrices[:, None, :2, 2]
+
+def main():
+    rng = np.random.default_rng(0)
+    objects, keys = 10_000, 6
+    times = np.sort(rng.uniform(0, 4, (objects, keys)), axis=1)
+    timeline = Timeline(times,
+                        rng.uniform(-500, 500, (objects, keys, 2)),
+                        rng.uniform(-360, 360, (objects, keys)),
+                        rng.uniform(0.5, 2, (objects, keys, 2)),
+                        easing=rng.choice(EASINGS, objects),
+                        budget_ms=16.0)
+
+    house = [(-30, -20), (30, -20), (30, 20), (0, 40), (-30, 20)]
+    fps = 60
+    for frame in range(4 * fps):
+        apply_matrices(timeline.evaluate(frame / fps), house)
+
+    report = timeline.report()
+    print(f"{objects} objects, {report['frames']} frames: "
+          f"mean {report['mean_ms']:.2f} ms, max {report['max_ms']:.2f} ms, "
+          f"{report['over_budget']} over the {report['budget_ms']:g} ms budget")
+
+if __name__ == "__main__":
+    main()
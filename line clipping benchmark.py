@@ -0,0 +1,70 @@
+import os
+import runpy
+import sys
+import time
+
+import numpy as np
+
+# Compare the batch line clipping engines of "cohen shutterland line clipping.py"
+# on inside-heavy, outside-heavy and crossing-heavy segment sets.
+#
+# Usage: python "line clipping benchmark.py" [segment count]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+clipping = runpy.run_path(os.path.join(HERE, "cohen shutterland line clipping.py"))
+clip_segments = clipping["clip_segments"]
+CLIP_ENGINES = clipping["CLIP_ENGINES"]
+
+# Same window as the clipping demo: (x_left, y_bottom, x_right, y_top)
+WINDOW = (120, 100, 500, 350)
+
+def inside_heavy(rng, n):
+    """Segments with both endpoints inside the window"""
+    left, bottom, right, top = WINDOW
+    x = rng.uniform(left, right, (n, 2))
+    y = rng.uniform(bottom, top, (n, 2))
+    return np.column_stack((x[:, 0], y[:, 0], x[:, 1], y[:, 1]))
+
+def outside_heavy(rng, n):
+    """Segments lying entirely in one of the bands around the window"""
+    left, bottom, right, top = WINDOW
+    seg = rng.uniform(0, 600, (n, 4))
+    # (columns to move, range) for the left, right, bottom and top bands
+    bands = (((0, 2), (0, left)), ((0, 2), (right, 600)),
+             ((1, 3), (0, bottom)), ((1, 3), (top, 500)))
+    band = rng.integers(0, len(bands), n)
+    for i, (columns, (low, high)) in enumerate(bands):
+        rows = np.flatnonzero(band == i)
+        seg[rows[:, None], columns] = rng.uniform(low, high, (len(rows), 2))
+    return seg
+
+def crossing_heavy(rng, n):
+    """Segments from outside on one side of the window to outside on another"""
+    left, bottom, right, top = WINDOW
+    y = rng.uniform(bottom, top, (n, 2))
+    x1 = rng.uniform(0, left, n)
+    x2 = rng.uniform(right, 600, n)
+    return np.column_stack((x1, y[:, 0], x2, y[:, 1]))
+
+def best_time(func, repeat=3):
+    """Best wall-clock time of several runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    print(f"{n} segments, window {WINDOW}")
+    print(f"{'data set':<16}" + "".join(f"{name:>20}" for name in CLIP_ENGINES))
+    for make in (inside_heavy, outside_heavy, crossing_heavy):
+        segments = make(rng, n)
+        times = [best_time(lambda: clip_segments(segments, WINDOW, name))
+                 for name in CLIP_ENGINES]
+        print(f"{make.__name__:<16}" + "".join(f"{t * 1000:>17.1f} ms" for t in times))
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,26 @@
 import turtle
 import math
 
-# Set up the screen
-screen = turtle.Screen()
-screen.bgcolor("white")
-screen.title("Sutherland-Hodgman Polygon Clipping Algorithm")
-screen.setup(width=900, height=700)
-screen.setworldcoordinates(0, 0, 900, 700)
-
-# Create a turtle
-pen = turtle.Turtle()
-pen.speed(0)
-pen.pensize(2)
+import numpy as np
+
+# The screen and pen are created by setup_screen(), so the clipping
+# functions can be used without a display
+screen = None
+pen = None
+
+def setup_screen():
+    """Set up the screen and the drawing turtle"""
+    global screen, pen
+    screen = turtle.Screen()
+    screen.bgcolor("white")
+    screen.title("Sutherland-Hodgman Polygon Clipping Algorithm")
+    screen.setup(width=900, height=700)
+    screen.setworldcoordinates(0, 0, 900, 700)
+
+    # Create a turtle
+    pen = turtle.Turtle()
+    pen.speed(0)
+    pen.pensize(2)
 
 # Clipping window coordinates
 clip_window = {
@@ -50,53 +59,57 @@ def draw_clipping_window():
     ]
     draw_polygon(vertices, "red")
 
-def is_inside(point, edge):
+def is_inside(point, edge, window=None):
     """Check if a point is inside relative to a clipping edge"""
+    if window is None:
+        window = clip_window
     x, y = point
     if edge == 'left':
-        return x >= clip_window['left']
+        return x >= window['left']
     elif edge == 'right':
-        return x <= clip_window['right']
+        return x <= window['right']
     elif edge == 'bottom':
-        return y >= clip_window['bottom']
+        return y >= window['bottom']
     elif edge == 'top':
-        return y <= clip_window['top']
+        return y <= window['top']
     return False
 
-def compute_intersection(p1, p2, edge):
+def compute_intersection(p1, p2, edge, window=None):
     """Compute intersection point of line segment with clipping edge"""
+    if window is None:
+        window = clip_window
     x1, y1 = p1
     x2, y2 = p2
     if edge == 'left':
-        x = clip_window['left']
+        x = window['left']
         if x2 - x1 != 0:
             y = y1 + (y2 - y1) * (x - x1) / (x2 - x1)
         else:
             y = y1
         return (x, y)
     elif edge == 'right':
-        x = clip_window['right']
+        x = window['right']
         if x2 - x1 != 0:
             y = y1 + (y2 - y1) * (x - x1) / (x2 - x1)
         else:
             y = y1
         return (x, y)
     elif edge == 'bottom':
-        y = clip_window['bottom']
+        y = window['bottom']
         if y2 - y1 != 0:
             x = x1 + (x2 - x1) * (y - y1) / (y2 - y1)
         else:
             x = x1
         return (x, y)
     elif edge == 'top':
-        y = clip_window['top']
+        y = window['top']
         if y2 - y1 != 0:
             x = x1 + (x2 - x1) * (y - y1) / (y2 - y1)
         else:
             x = x1
         return (x, y)
 
-def clip_polygon_against_edge(vertices, edge):
+def clip_polygon_against_edge(vertices, edge, window=None):
     """Clip polygon against a single edge using Sutherland-Hodgman algorithm"""
     if len(vertices) == 0:
         return []
@@ -106,33 +119,339 @@ def clip_polygon_against_edge(vertices, edge):
         prev_vertex = vertices[-1]
         for current_vertex in vertices:
             # Check if current vertex is inside
-            if is_inside(current_vertex, edge):
+            if is_inside(current_vertex, edge, window):
                 # If previous vertex was outside, add intersection
-                if not is_inside(prev_vertex, edge):
-                    intersection = compute_intersection(prev_vertex, current_vertex, edge)
+                if not is_inside(prev_vertex, edge, window):
+                    intersection = compute_intersection(prev_vertex, current_vertex, edge, window)
                     clipped_vertices.append(intersection)
                 # Add current vertex
                 clipped_vertices.append(current_vertex)
             else:
                 # Current vertex is outside
                 # If previous vertex was inside, add intersection
-                if is_inside(prev_vertex, edge):
-                    intersection = compute_intersection(prev_vertex, current_vertex, edge)
+                if is_inside(prev_vertex, edge, window):
+                    intersection = compute_intersection(prev_vertex, current_vertex, edge, window)
                     clipped_vertices.append(intersection)
             prev_vertex = current_vertex
     return clipped_vertices
 
-def sutherland_hodgman_clip(vertices):
-    """Apply Sutherland-Hodgman clipping algorithm"""
+def polygon_bbox(vertices):
+    """Bounding box (xmin, ymin, xmax, ymax) of a polygon"""
+    xs, ys = zip(*vertices)
+    return (min(xs), min(ys), max(xs), max(ys))
+
+def sutherland_hodgman_clip(vertices, window=None, bbox=None):
+    """Apply Sutherland-Hodgman clipping algorithm
+
+    window is a dict like clip_window; by default clip_window itself.
+    With the polygon's bbox (see polygon_bbox) given, polygons entirely
+    inside or outside the window are returned unchanged or empty without
+    walking their vertices.
+    """
+    if window is None:
+        window = clip_window
+    if bbox is not None:
+        xmin, ymin, xmax, ymax = bbox
+        if (xmin >= window['left'] and xmax <= window['right'] and
+                ymin >= window['bottom'] and ymax <= window['top']):
+            return vertices[:]
+        if (xmax < window['left'] or xmin > window['right'] or
+                ymax < window['bottom'] or ymin > window['top']):
+            return []
     # Clip against each edge in order: left, right, bottom, top
     edges = ['left', 'right', 'bottom', 'top']
     clipped_polygon = vertices[:]
     for edge in edges:
-        clipped_polygon = clip_polygon_against_edge(clipped_polygon, edge)
+        clipped_polygon = clip_polygon_against_edge(clipped_polygon, edge, window)
         if len(clipped_polygon) == 0:
             break
     return clipped_polygon
 
+def make_clip_stages(window=None):
+    """Precompute the clipping edges of a window as (axis, bound, keep_greater)
+
+    axis is 0 for x and 1 for y; a point is inside the edge when its
+    coordinate is >= bound (keep_greater) or <= bound. Stages are in the
+    same order as sutherland_hodgman_clip: left, right, bottom, top.
+    """
+    if window is None:
+        window = clip_window
+    return [
+        (0, window['left'], True),
+        (0, window['right'], False),
+        (1, window['bottom'], True),
+        (1, window['top'], False),
+    ]
+
+def edge_crossing(p1, p2, axis, bound):
+    """Point where segment p1-p2 crosses the line coordinate[axis] == bound"""
+    t = (bound - p1[axis]) / (p2[axis] - p1[axis])
+    if axis == 0:
+        return (bound, p1[1] + (p2[1] - p1[1]) * t)
+    return (p1[0] + (p2[0] - p1[0]) * t, bound)
+
+def clip_stage(points, axis, bound, keep_greater):
+    """Lazily clip a stream of polygon vertices against one edge
+
+    Only the first and previous vertices are remembered; the closing edge
+    (last -> first vertex) is handled once the input stream ends.
+    """
+    first = prev = None
+    first_in = prev_in = False
+    for point in points:
+        c = point[axis]
+        point_in = c >= bound if keep_greater else c <= bound
+        if first is None:
+            first = point
+            first_in = point_in
+        elif point_in != prev_in:
+            yield edge_crossing(prev, point, axis, bound)
+        if point_in:
+            yield point
+        prev = point
+        prev_in = point_in
+    if first is not None and first_in != prev_in:
+        yield edge_crossing(prev, first, axis, bound)
+
+def sutherland_hodgman_pipeline(vertices, window=None, stages=None):
+    """Reentrant single-pass Sutherland-Hodgman clipping
+
+    The edge stages are chained generators, so each vertex travels through
+    all of them as soon as it is read and no intermediate polygon is built
+    between edges. Pass stages from make_clip_stages() to reuse them
+    across calls.
+
+    The result is the same polygon as sutherland_hodgman_clip, possibly
+    starting at a different vertex.
+    """
+    if stages is None:
+        stages = make_clip_stages(window)
+    points = iter(vertices)
+    for axis, bound, keep_greater in stages:
+        points = clip_stage(points, axis, bound, keep_greater)
+    return list(points)
+
+def pack_polygons(polygons):
+    """Pack a list of polygons into (coords, offsets) arrays
+
+    coords is a flat (V, 2) float64 array of all vertices and polygon i is
+    coords[offsets[i]:offsets[i + 1]], so offsets has one more entry than
+    there are polygons.
+    """
+    sizes = [len(vertices) for vertices in polygons]
+    offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    coords = np.array([p for vertices in polygons for p in vertices],
+                      dtype=np.float64).reshape(-1, 2)
+    return coords, offsets
+
+def unpack_polygons(coords, offsets):
+    """Turn (coords, offsets) arrays back into a list of polygons"""
+    points = [tuple(p) for p in np.asarray(coords).tolist()]
+    bounds = np.asarray(offsets).tolist()
+    return [points[a:b] for a, b in zip(bounds, bounds[1:])]
+
+def clip_packed_stage(coords, offsets, dist, snap=None):
+    """Clip every packed polygon against one half-plane in a single NumPy pass
+
+    dist holds each vertex's signed distance to the clipping edge, inside
+    where dist >= 0. Vertex by vertex this does what
+    clip_polygon_against_edge does: each vertex emits the crossing of the
+    edge from its predecessor (if any) followed by itself (if inside).
+    snap=(axis, bound) puts crossings exactly on an axis-aligned edge.
+    """
+    n = len(coords)
+    sizes = np.diff(offsets)
+    # Index of each vertex's predecessor, wrapping to the polygon's last vertex
+    prev = np.arange(n) - 1
+    nonempty = sizes > 0
+    prev[offsets[:-1][nonempty]] = offsets[1:][nonempty] - 1
+
+    inside = dist >= 0
+    crossing = inside != inside[prev]
+
+    counts = crossing.astype(np.int64) + inside
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    out = np.empty((ends[-1] if n else 0, 2))
+
+    # Intersection points come first, then the vertex itself
+    i = np.flatnonzero(crossing)
+    j = prev[i]
+    t = dist[j] / (dist[j] - dist[i])
+    hit = coords[j] + (coords[i] - coords[j]) * t[:, None]
+    if snap is not None:
+        hit[:, snap[0]] = snap[1]
+    out[starts[i]] = hit
+    i = np.flatnonzero(inside)
+    out[starts[i] + crossing[i]] = coords[i]
+
+    new_offsets = np.concatenate(([0], ends))[offsets]
+    return out, new_offsets
+
+class ConvexWindow:
+    """Convex clipping window, e.g. a rotated viewport
+
+    The window's edges are turned once into half-plane coefficients
+    (a, b, c), a point (x, y) being inside an edge when a*x + b*y + c >= 0,
+    so reusing a window only costs the clipping arithmetic.
+    """
+
+    def __init__(self, vertices):
+        v = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        if len(v) < 3:
+            raise ValueError("a clipping window needs at least 3 vertices")
+        nxt = np.roll(v, -1, axis=0)
+        # Orient counter-clockwise so the inside is to the left of each edge
+        if np.sum(v[:, 0] * nxt[:, 1] - nxt[:, 0] * v[:, 1]) < 0:
+            v = v[::-1]
+            nxt = np.roll(v, -1, axis=0)
+        a = v[:, 1] - nxt[:, 1]
+        b = nxt[:, 0] - v[:, 0]
+        c = -(a * v[:, 0] + b * v[:, 1])
+        self.vertices = v
+        self.normals = np.column_stack((a, b))
+        self.offsets = c
+
+    @classmethod
+    def from_rect(cls, window):
+        """Build a window from a dict like clip_window"""
+        return cls([(window['left'], window['bottom']), (window['right'], window['bottom']),
+                    (window['right'], window['top']), (window['left'], window['top'])])
+
+    def contains(self, points):
+        """Boolean mask of the (N, 2) points that lie inside the window"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return np.all(points @ self.normals.T + self.offsets >= 0, axis=1)
+
+    def clip_packed(self, coords, offsets):
+        """Clip packed polygons (see pack_polygons) against the window"""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        for normal, offset in zip(self.normals, self.offsets):
+            coords, offsets = clip_packed_stage(coords, offsets, coords @ normal + offset)
+        return coords, offsets
+
+    def clip(self, vertices):
+        """Clip a single polygon given as a list of (x, y)"""
+        coords, offsets = self.clip_packed(*pack_polygons([vertices]))
+        return unpack_polygons(coords, offsets)[0]
+
+def sutherland_hodgman_clip_packed(coords, offsets, window=None):
+    """Clip a batch of packed polygons (see pack_polygons) in one call
+
+    window is a dict like clip_window (the default) or a ConvexWindow.
+    Returns the clipped polygons in the same (coords, offsets) layout, with
+    one entry per input polygon (empty when fully clipped away). For a
+    rectangular window each polygon matches sutherland_hodgman_clip vertex
+    for vertex.
+    """
+    if isinstance(window, ConvexWindow):
+        return window.clip_packed(coords, offsets)
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    for axis, bound, keep_greater in make_clip_stages(window):
+        dist = coords[:, axis] - bound if keep_greater else bound - coords[:, axis]
+        coords, offsets = clip_packed_stage(coords, offsets, dist, snap=(axis, bound))
+    return coords, offsets
+
+class PolygonSet:
+    """Packed polygons (see pack_polygons) with cached bounding boxes
+
+    Keep a PolygonSet around for polygons that are clipped repeatedly, e.g.
+    every frame: the bounding boxes are computed on first use only.
+    """
+
+    def __init__(self, coords, offsets):
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self._bboxes = None
+
+    @classmethod
+    def from_polygons(cls, polygons):
+        """Build a set from a list of polygons (lists of (x, y))"""
+        return cls(*pack_polygons(polygons))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def bboxes(self):
+        """(N, 4) array of (xmin, ymin, xmax, ymax); NaN for empty polygons"""
+        if self._bboxes is None:
+            bboxes = np.full((len(self), 4), np.nan)
+            nonempty = np.diff(self.offsets) > 0
+            starts = self.offsets[:-1][nonempty]
+            if len(starts):
+                bboxes[nonempty, :2] = np.minimum.reduceat(self.coords, starts)
+                bboxes[nonempty, 2:] = np.maximum.reduceat(self.coords, starts)
+            self._bboxes = bboxes
+        return self._bboxes
+
+def classify_bboxes(bboxes, window=None):
+    """Trivially accept (1), reject (-1) or mark for clipping (0) each bbox
+
+    window is a dict like clip_window (the default) or a ConvexWindow.
+    Empty polygons (NaN boxes) are rejected.
+    """
+    bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    xmin, ymin, xmax, ymax = bboxes.T
+    if isinstance(window, ConvexWindow):
+        corners = np.stack((np.column_stack((xmin, ymin)), np.column_stack((xmax, ymin)),
+                            np.column_stack((xmax, ymax)), np.column_stack((xmin, ymax))), axis=1)
+        dist = corners @ window.normals.T + window.offsets
+        inside = np.all(dist >= 0, axis=(1, 2))
+        # All four corners beyond the same edge
+        outside = np.any(np.all(dist < 0, axis=1), axis=1)
+    else:
+        if window is None:
+            window = clip_window
+        inside = ((xmin >= window['left']) & (xmax <= window['right']) &
+                  (ymin >= window['bottom']) & (ymax <= window['top']))
+        outside = ((xmax < window['left']) | (xmin > window['right']) |
+                   (ymax < window['bottom']) | (ymin > window['top']))
+    outside |= np.isnan(xmin)
+    return np.where(inside, 1, np.where(outside, -1, 0))
+
+def gather_polygons(coords, starts, sizes):
+    """Pack the polygons coords[starts[i]:starts[i] + sizes[i]] into (coords, offsets)"""
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    index = np.repeat(starts - offsets[:-1], sizes) + np.arange(offsets[-1])
+    return coords[index], offsets
+
+def clip_polygon_set(polygons, window=None):
+    """Clip a PolygonSet, skipping polygons whose bbox decides the result
+
+    Polygons entirely inside the window are passed through unchanged and
+    those entirely outside come back empty; only the rest go through
+    sutherland_hodgman_clip_packed. Returns (coords, offsets, stats), the
+    result packed like the input, with stats counting the 'accepted',
+    'rejected' and 'clipped' polygons of this call.
+    """
+    code = classify_bboxes(polygons.bboxes, window)
+    starts = polygons.offsets[:-1]
+    sizes = np.diff(polygons.offsets)
+    todo = np.flatnonzero(code == 0)
+
+    clipped, clipped_offsets = sutherland_hodgman_clip_packed(
+        *gather_polygons(polygons.coords, starts[todo], sizes[todo]), window)
+
+    # Read accepted polygons from the input and clipped ones from the
+    # clipper's output, appended after the input coordinates
+    out_starts = starts.copy()
+    out_sizes = np.where(code == 1, sizes, 0)
+    out_starts[todo] = len(polygons.coords) + clipped_offsets[:-1]
+    out_sizes[todo] = np.diff(clipped_offsets)
+    coords, offsets = gather_polygons(np.concatenate((polygons.coords, clipped)),
+                                      out_starts, out_sizes)
+    stats = {
+        'accepted': int(np.sum(code == 1)),
+        'rejected': int(np.sum(code == -1)),
+        'clipped': len(todo),
+    }
+    return coords, offsets, stats
+
 def draw_text_info():
     """Draw information text"""
     pen.penup()
@@ -149,6 +468,7 @@ def draw_text_info():
 
 
 def main():
+    setup_screen()
     # Draw information text
     draw_text_info()
     # Draw clipping window
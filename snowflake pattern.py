@@ -1,19 +1,33 @@
 import turtle
+import contextlib
 import math
+import os
+import tempfile
 import time
+import multiprocessing
+from functools import lru_cache
 
-# Set up the screen
-screen = turtle.Screen()
-screen.bgcolor("white")
-screen.title("Koch Snowflake Fractal")
-screen.setup(width=800, height=700)
-screen.setworldcoordinates(0, 0, 500, 400)
+import numpy as np
 
-# Create a turtle for drawing
-pen = turtle.Turtle()
-pen.speed(10)
-pen.pensize(3)
-pen.color("cyan")
+# The screen and pen are created by setup_screen(), so the fractal
+# generators can be used without a display
+screen = None
+pen = None
+
+def setup_screen():
+    """Set up the screen and the drawing turtle"""
+    global screen, pen
+    screen = turtle.Screen()
+    screen.bgcolor("white")
+    screen.title("Koch Snowflake Fractal")
+    screen.setup(width=800, height=700)
+    screen.setworldcoordinates(0, 0, 500, 400)
+
+    # Create a turtle for drawing
+    pen = turtle.Turtle()
+    pen.speed(10)
+    pen.pensize(3)
+    pen.color("cyan")
 
 def draw_line(x1, y1, x2, y2):
     """Draw a line from (x1, y1) to (x2, y2)"""
@@ -22,12 +36,13 @@ def draw_line(x1, y1, x2, y2):
     pen.pendown()
     pen.goto(x2, y2)
 
-def snowflake(x1, y1, x5, y5, iteration):
+def snowflake(x1, y1, x5, y5, iteration, delay=0.001):
     """
     Recursive function to draw Koch snowflake
     (x1, y1) - starting point
     (x5, y5) - ending point
     iteration - recursion depth
+    delay - pause after each line to visualize the drawing (0 for none)
     """
     if iteration > 0:
         # Calculate the five key points for Koch curve
@@ -62,15 +77,246 @@ def snowflake(x1, y1, x5, y5, iteration):
         
         # Recursively draw the four segments
         for i in range(4):
-            snowflake(points[i][0], points[i][1], points[i+1][0], points[i+1][1], iteration - 1)
+            snowflake(points[i][0], points[i][1], points[i+1][0], points[i+1][1],
+                      iteration - 1, delay)
     else:
         # Base case: draw a straight line
         draw_line(x1, y1, x5, y5)
-        time.sleep(0.001)  # Small delay to visualize the drawing process
+        if delay:
+            time.sleep(delay)  # Small delay to visualize the drawing process
+
+def koch_step(points):
+    """Replace every segment of an (M + 1, 2) polyline by its 4 Koch segments
+
+    The same five key points as in snowflake() are computed for all
+    segments at once, giving a (4M + 1, 2) polyline.
+    """
+    a = points[:-1]
+    b = points[1:]
+    d = (b - a) / 3
+    # Peak of the equilateral triangle, rotated 60 degrees as in snowflake()
+    peak = (a + b) / 2 + math.sqrt(3) * np.column_stack((a[:, 1] - b[:, 1],
+                                                         b[:, 0] - a[:, 0])) / 6
+    out = np.empty((4 * len(a) + 1, 2))
+    out[0:-1:4] = a
+    out[1::4] = a + d
+    out[2::4] = peak
+    out[3::4] = a + 2 * d
+    out[-1] = points[-1]
+    return out
+
+def koch_curve(x1, y1, x5, y5, iteration):
+    """Vertices of the Koch curve from (x1, y1) to (x5, y5), without recursion
+
+    Builds the curve level by level, one vectorized koch_step per level.
+    Returns a (4**iteration + 1, 2) array, in the order snowflake() draws.
+    """
+    points = np.array([[x1, y1], [x5, y5]], dtype=np.float64)
+    for _ in range(iteration):
+        points = koch_step(points)
+    return points
+
+@lru_cache(maxsize=16)
+def koch_template(iteration):
+    """Koch curve from (0, 0) to (1, 0), computed once per depth (read-only)"""
+    points = koch_curve(0.0, 0.0, 1.0, 0.0, iteration)
+    points.flags.writeable = False
+    return points
+
+def edge_affine(x1, y1, x5, y5):
+    """2x3 affine matrix mapping (0, 0) -> (x1, y1) and (1, 0) -> (x5, y5)
+
+    The map is a rotation and uniform scale, so the template's peaks stay
+    on the left of the edge, as in snowflake().
+    """
+    dx = x5 - x1
+    dy = y5 - y1
+    return np.array([[dx, -dy, x1],
+                     [dy, dx, y1]], dtype=np.float64)
+
+def koch_edge(x1, y1, x5, y5, iteration):
+    """Koch curve on one edge: the cached template under one affine transform"""
+    m = edge_affine(x1, y1, x5, y5)
+    return koch_template(iteration) @ m[:, :2].T + m[:, 2]
+
+def koch_edges(edges, iteration):
+    """Koch curves on an (E, 4) array of edges (x1, y1, x5, y5)
+
+    Returns an (E, 4**iteration + 1, 2) array, all edges transformed from
+    the cached template in one broadcasted operation.
+    """
+    edges = np.asarray(edges, dtype=np.float64).reshape(-1, 4)
+    d = edges[:, 2:] - edges[:, :2]
+    template = koch_template(iteration)
+    # Rotate and scale (t_x, t_y) by (d_x, d_y), then move to the start point
+    x = template[:, 0] * d[:, :1] - template[:, 1] * d[:, 1:] + edges[:, :1]
+    y = template[:, 0] * d[:, 1:] + template[:, 1] * d[:, :1] + edges[:, 1:2]
+    return np.stack((x, y), axis=-1)
+
+def koch_snowflake(vertices, iteration):
+    """Closed polyline of the Koch snowflake built on a triangle's vertices"""
+    sides = [koch_edge(*vertices[i], *vertices[(i + 1) % 3], iteration)[:-1]
+             for i in range(3)]
+    return np.concatenate(sides + [np.asarray(vertices[:1], dtype=np.float64)])
+
+def koch_edges_into(edges, iteration, out, block_iteration=8):
+    """Write the Koch curves of an (E, 4) array of edges straight into out
+
+    out is an (E * 4**iteration, 2) array; each curve's last vertex (the
+    next edge's first) is not written. Work is done in blocks of about
+    4**block_iteration vertices: deeper curves are first split into
+    sub-edges, a few levels at a time, so no temporary ever holds a whole
+    curve and nothing is copied after being computed.
+    """
+    edges = np.asarray(edges, dtype=np.float64).reshape(-1, 4)
+    rows = 4 ** iteration
+    if iteration > block_iteration:
+        top = min(iteration - block_iteration, block_iteration)
+        for i, edge in enumerate(edges):
+            points = koch_edges(edge, top)[0]
+            koch_edges_into(np.column_stack((points[:-1], points[1:])), iteration - top,
+                            out[i * rows:(i + 1) * rows], block_iteration)
+        return
+
+    template = koch_template(iteration)[:-1]
+    batch = max(1, 4 ** block_iteration // rows)
+    for start in range(0, len(edges), batch):
+        e = edges[start:start + batch]
+        d = e[:, 2:] - e[:, :2]
+        view = out[start * rows:(start + len(e)) * rows].reshape(len(e), rows, 2)
+        # Same rotation and scale of the template as koch_edges, in place
+        x = view[..., 0]
+        y = view[..., 1]
+        np.multiply(template[:, 0], d[:, :1], out=x)
+        x -= template[:, 1] * d[:, 1:]
+        x += e[:, :1]
+        np.multiply(template[:, 0], d[:, 1:], out=y)
+        y += template[:, 1] * d[:, :1]
+        y += e[:, 1:2]
+
+def koch_worker(path, total, edges, first_row, iteration):
+    """Write the Koch curves of consecutive edges into the shared output file
+
+    Edge i fills rows first_row + i * 4**iteration onwards (its last
+    vertex is the next edge's first, so it is not written).
+    """
+    out = np.memmap(path, dtype=np.float64, mode="r+", shape=(total, 2))
+    koch_edges_into(edges, iteration, out[first_row:first_row + len(edges) * 4 ** iteration])
+    del out
+
+def koch_polyline_parallel(points, iteration, split_iteration=None, processes=None,
+                           path=None):
+    """Koch curve on every segment of a polyline, generated by a process pool
+
+    The polyline is refined split_iteration times in this process (by
+    default just enough for a few sub-edges per worker); the resulting
+    sub-edges (independent subtrees) are then shared out between
+    `processes` workers (default: one per CPU) in contiguous runs. Each
+    worker writes its vertices straight into one memory-mapped output, so
+    no vertex lists are pickled or copied. Returns a (P * 4**iteration + 1, 2)
+    array for a polyline of P segments, in drawing order.
+
+    The output is a numpy.memmap of path, by default a temporary file in
+    shared memory (/dev/shm where available) that is deleted right away;
+    its memory is freed when the last reference to the array goes.
+
+    Workers are started with multiprocessing.Process; with the "spawn"
+    start method this module must be importable, e.g. run as a script.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    processes = processes or multiprocessing.cpu_count()
+    if split_iteration is None:
+        split_iteration = 0
+        while (len(points) - 1) * 4 ** split_iteration < 4 * processes:
+            split_iteration += 1
+    split_iteration = min(split_iteration, iteration)
+    for _ in range(split_iteration):
+        points = koch_step(points)
+    edges = np.column_stack((points[:-1], points[1:]))
+    rest = iteration - split_iteration
+    total = len(edges) * 4 ** rest + 1
+
+    owned = path is None
+    if owned:
+        folder = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        fd, path = tempfile.mkstemp(suffix=".koch", dir=folder)
+        os.close(fd)
+    try:
+        out = np.memmap(path, dtype=np.float64, mode="w+", shape=(total, 2))
+        processes = min(processes, len(edges))
+        bounds = np.linspace(0, len(edges), processes + 1).astype(int)
+        workers = [multiprocessing.Process(
+                       target=koch_worker,
+                       args=(path, total, edges[a:b], a * 4 ** rest, rest))
+                   for a, b in zip(bounds[:-1], bounds[1:])]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        if any(worker.exitcode != 0 for worker in workers):
+            raise RuntimeError("a Koch worker process failed")
+        out[-1] = points[-1]
+    finally:
+        if owned:
+            # The mapping stays valid after the name is gone (POSIX)
+            with contextlib.suppress(OSError):
+                os.remove(path)
+    return out
+
+def koch_snowflake_parallel(vertices, iteration, split_iteration=None, processes=None,
+                            path=None):
+    """Closed Koch snowflake polyline generated by koch_polyline_parallel"""
+    closed = list(vertices) + [vertices[0]]
+    return koch_polyline_parallel(closed, iteration, split_iteration, processes, path)
+
+def koch_lod(x1, y1, x5, y5, tolerance=1.0, scale=1.0, view=None, max_iteration=40):
+    """Lazily yield Koch curve vertices at the detail visible on screen
+
+    A segment is subdivided only while its length on screen (world length
+    times scale, in pixels per world unit) is above tolerance pixels. If
+    view = (x_min, y_min, x_max, y_max) is given, segments whose bounding
+    triangle (the segment and its Koch peak, which contains the whole
+    subcurve) misses the view are not subdivided either. Vertices come out
+    in drawing order, starting with (x1, y1), so the cost per frame depends
+    on what is visible rather than on the depth.
+    """
+    yield (x1, y1)
+    stack = [(x1, y1, x5, y5, 0)]
+    while stack:
+        ax, ay, bx, by, iteration = stack.pop()
+        dx = (bx - ax) / 3
+        dy = (by - ay) / 3
+        peak_x = (ax + bx) / 2 + math.sqrt(3) * (ay - by) / 6
+        peak_y = (ay + by) / 2 + math.sqrt(3) * (bx - ax) / 6
+
+        fine = math.hypot(bx - ax, by - ay) * scale <= tolerance
+        hidden = view is not None and (
+            max(ax, bx, peak_x) < view[0] or min(ax, bx, peak_x) > view[2] or
+            max(ay, by, peak_y) < view[1] or min(ay, by, peak_y) > view[3])
+        if fine or hidden or iteration >= max_iteration:
+            yield (bx, by)
+            continue
+
+        # Push the four sub-segments so the first one is popped first
+        points = [(ax, ay), (ax + dx, ay + dy), (peak_x, peak_y),
+                  (ax + 2 * dx, ay + 2 * dy), (bx, by)]
+        for i in range(3, -1, -1):
+            stack.append((*points[i], *points[i + 1], iteration + 1))
+
+def draw_polyline(points, delay=0):
+    """Draw a polyline in a single pass, optionally pausing after each segment"""
+    pen.penup()
+    pen.goto(*points[0])
+    pen.pendown()
+    for x, y in points[1:].tolist():
+        pen.goto(x, y)
+        if delay:
+            time.sleep(delay)
 
 
 def main():
-    
+    setup_screen()
+
     # Set up the initial triangle vertices (same as C++ code)
     # These form an equilateral triangle
     triangle_vertices = [
@@ -86,15 +332,9 @@ def main():
     counter_pen = turtle.Turtle()
 
     
-    # Draw the three sides of the Koch snowflake
+    # Draw the three sides of the Koch snowflake as one polyline
     pen.color("blue")
-    for i in range(3):
-        # Get current and next vertex (wrapping around with modulo)
-        x1, y1 = triangle_vertices[i]
-        x2, y2 = triangle_vertices[(i + 1) % 3]
-        
-        # Draw Koch curve for this side
-        snowflake(x1, y1, x2, y2, iteration)
+    draw_polyline(koch_snowflake(triangle_vertices, iteration), delay=0.001)
     
     # Hide the drawing pen and wait for click
     pen.hideturtle()
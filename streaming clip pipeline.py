@@ -0,0 +1,141 @@
+import os
+import runpy
+import tempfile
+import time
+
+import numpy as np
+
+# Streaming, bounded-memory clipping of segment and polygon files.
+#
+# Inputs are read in chunks through numpy.memmap, clipped with the existing
+# clippers and appended to the output files chunk by chunk, so memory use
+# depends on the chunk size, not on the size of the input.
+#
+# File formats (raw little-endian, no header):
+#   segments: float64 rows (x1, y1, x2, y2)
+#   polygons: a coordinate file of float64 rows (x, y) and an offsets file
+#             of int64 values, where polygon i is rows offsets[i]:offsets[i + 1]
+#             (offsets[0] == 0, one more offset than polygons)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+line_clipping = runpy.run_path(os.path.join(HERE, "cohen shutterland line clipping.py"))
+polygon_clipping = runpy.run_path(
+    os.path.join(HERE, "shutterland hodgman polygon clipping algorithm.py"))
+clip_segments = line_clipping["clip_segments"]
+sutherland_hodgman_clip_packed = polygon_clipping["sutherland_hodgman_clip_packed"]
+
+def read_array(path, dtype, width=None):
+    """Memory-map a raw file; an empty file gives an empty array (mmap cannot map it)"""
+    if os.path.getsize(path) == 0:
+        array = np.empty(0, dtype=dtype)
+    else:
+        array = np.memmap(path, dtype=dtype, mode="r")
+    return array if width is None else array.reshape(-1, width)
+
+def read_segments(path):
+    """Memory-map a segment file as an (N, 4) float64 array"""
+    return read_array(path, "<f8", 4)
+
+def iter_segment_chunks(path, chunk_size=1_000_000):
+    """Yield successive (chunk_size, 4) views of a segment file"""
+    segments = read_segments(path)
+    for start in range(0, len(segments), chunk_size):
+        yield segments[start:start + chunk_size]
+
+def clip_segment_chunks(chunks, window, engine="cohen-sutherland"):
+    """Clip each chunk of segments, yielding only the visible clipped segments"""
+    for chunk in chunks:
+        clipped, accept = clip_segments(chunk, window, engine)
+        yield clipped[accept]
+
+def write_segment_chunks(chunks, path):
+    """Append each chunk to a segment file; return the number of segments written"""
+    count = 0
+    with open(path, "wb") as f:
+        for chunk in chunks:
+            f.write(np.ascontiguousarray(chunk, dtype="<f8").tobytes())
+            count += len(chunk)
+    return count
+
+def clip_segment_file(in_path, out_path, window, chunk_size=1_000_000,
+                      engine="cohen-sutherland"):
+    """Clip a segment file against window (x_left, y_bottom, x_right, y_top)
+
+    Returns the number of segments written to out_path.
+    """
+    chunks = iter_segment_chunks(in_path, chunk_size)
+    return write_segment_chunks(clip_segment_chunks(chunks, window, engine), out_path)
+
+def read_polygons(coords_path, offsets_path):
+    """Memory-map a polygon file pair as (coords, offsets) arrays"""
+    return read_array(coords_path, "<f8", 2), read_array(offsets_path, "<i8")
+
+def iter_polygon_chunks(coords_path, offsets_path, chunk_size=100_000):
+    """Yield successive (coords, offsets) chunks of at most chunk_size polygons
+
+    Each chunk is in the packed layout of sutherland_hodgman_clip_packed,
+    with its offsets rebased to start at 0.
+    """
+    coords, offsets = read_polygons(coords_path, offsets_path)
+    for first in range(0, len(offsets) - 1, chunk_size):
+        bounds = np.array(offsets[first:first + chunk_size + 1])
+        yield coords[bounds[0]:bounds[-1]], bounds - bounds[0]
+
+def clip_polygon_chunks(chunks, window):
+    """Clip each packed chunk of polygons, yielding the results packed
+
+    Fully clipped polygons stay in as empty entries, so output polygon k
+    is always input polygon k and can be joined back to its attributes.
+    """
+    left, bottom, right, top = window
+    window = {'left': left, 'right': right, 'bottom': bottom, 'top': top}
+    for coords, offsets in chunks:
+        yield sutherland_hodgman_clip_packed(coords, offsets, window)
+
+def write_polygon_chunks(chunks, coords_path, offsets_path):
+    """Append each packed chunk to a polygon file pair; return the number of polygons written"""
+    count = 0
+    end = 0
+    with open(coords_path, "wb") as coords_file, open(offsets_path, "wb") as offsets_file:
+        offsets_file.write(np.array([0], dtype="<i8").tobytes())
+        for coords, offsets in chunks:
+            coords_file.write(np.ascontiguousarray(coords, dtype="<f8").tobytes())
+            offsets_file.write((end + offsets[1:]).astype("<i8").tobytes())
+            end += int(offsets[-1])
+            count += len(offsets) - 1
+    return count
+
+def clip_polygon_file(coords_in, offsets_in, coords_out, offsets_out, window,
+                      chunk_size=100_000):
+    """Clip a polygon file pair against window (x_left, y_bottom, x_right, y_top)
+
+    Returns the number of polygons written to the output file pair, one
+    (possibly empty) polygon per input polygon.
+    """
+    chunks = iter_polygon_chunks(coords_in, offsets_in, chunk_size)
+    return write_polygon_chunks(clip_polygon_chunks(chunks, window),
+                                coords_out, offsets_out)
+
+def main():
+    rng = np.random.default_rng(0)
+    window = (120, 100, 500, 350)
+    with tempfile.TemporaryDirectory() as folder:
+        in_path = os.path.join(folder, "segments.bin")
+        out_path = os.path.join(folder, "clipped.bin")
+
+        # Write the input a chunk at a time as well
+        n = 0
+        with open(in_path, "wb") as f:
+            for _ in range(10):
+                chunk = rng.uniform(0, 600, (1_000_000, 4))
+                f.write(chunk.astype("<f8").tobytes())
+                n += len(chunk)
+
+        begin = time.perf_counter()
+        written = clip_segment_file(in_path, out_path, window, chunk_size=250_000)
+        elapsed = time.perf_counter() - begin
+        print(f"clipped {n} segments in {elapsed:.2f} s "
+              f"({n / elapsed / 1e6:.1f} M segments/s), {written} visible")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# The lab scripts have spaces in their names, so they are loaded by path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session")
+def load_script():
+    """Return a function that imports a lab script by file name"""
+    modules = {}
+
+    def load(filename):
+        if filename not in modules:
+            name = filename[:-3].replace(" ", "_")
+            spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+            modules[filename] = module
+        return modules[filename]
+
+    return load
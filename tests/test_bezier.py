@@ -0,0 +1,46 @@
+import numpy as np
+
+DEMO_POINTS = [(27, 243), (101, 47), (324, 197), (437, 23)]
+
+
+def inside(box, points):
+    xmin, ymin, xmax, ymax = box
+    return np.all((points[:, 0] >= xmin) & (points[:, 0] <= xmax) &
+                  (points[:, 1] >= ymin) & (points[:, 1] <= ymax))
+
+
+def test_dirty_box_covers_changed_segments(load_script):
+    bezier = load_script("bezier curve.py")
+    rng = np.random.default_rng(0)
+    for samples, threshold in [(11, 0.0), (101, 0.0), (101, 0.5)]:
+        curve = bezier.EditableBezier(DEMO_POINTS, samples=samples)
+        for _ in range(50):
+            k = int(rng.integers(4))
+            before = curve.curve.copy()
+            box = curve.move_point(k, *rng.uniform(0, 500, 2), threshold=threshold)
+            after = curve.curve
+            # A segment changed if either of its end samples moved at all
+            shifted = np.any(before != after, axis=1)
+            changed = shifted[:-1] | shifted[1:]
+            if box is None:
+                assert threshold > 0
+                continue
+            for i in np.flatnonzero(changed):
+                moved = np.hypot(*(after[i:i + 2] - before[i:i + 2]).T) > threshold
+                if moved.any():
+                    assert inside(box, before[i:i + 2]) and inside(box, after[i:i + 2])
+
+
+def test_dirty_box_includes_fixed_neighbours(load_script):
+    bezier = load_script("bezier curve.py")
+    box = bezier.EditableBezier(DEMO_POINTS, samples=11).move_point(1, 101, 400)
+    assert box[0] == 27
+
+
+def test_bernstein_matrix_matches_scalar_basis(load_script):
+    bezier = load_script("bezier curve.py")
+    basis = bezier.bernstein_matrix(3, 11)
+    assert not basis.flags.writeable
+    expected = [[bezier.bezier_function(k, 3, i / 10) for k in range(4)] for i in range(11)]
+    assert np.allclose(basis, expected)
+    assert np.allclose(basis, bezier.bernstein_at(3, np.linspace(0, 1, 11)))
@@ -0,0 +1,18 @@
+import numpy as np
+
+
+def test_fill_spans_matches_put_pixels(load_script):
+    from canvas import Framebuffer
+    rng = np.random.default_rng(0)
+    spans = np.column_stack((rng.integers(-30, 30, 500),
+                             rng.integers(-60, 60, 500),
+                             rng.integers(-60, 60, 500)))
+    spans[:, 2] = np.maximum(spans[:, 1] - 1, spans[:, 2])  # some empty spans
+    by_spans = Framebuffer(80, 40, origin=(40, 20))
+    by_spans.fill_spans(spans, "red")
+
+    by_pixels = Framebuffer(80, 40, origin=(40, 20))
+    for y, x0, x1 in spans.tolist():
+        xs = np.arange(x0, x1 + 1)
+        by_pixels.put_pixels(xs, np.full(len(xs), y), "red")
+    assert np.array_equal(by_spans.pixels, by_pixels.pixels)
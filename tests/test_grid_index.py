@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("cell_size, bounds", [
+    (0, (0, 0, 10, 10)),
+    (-1, (0, 0, 10, 10)),
+    (np.nan, (0, 0, 10, 10)),
+    (1, (0, 0, np.inf, 10)),
+])
+def test_invalid_grid_raises(load_script, cell_size, bounds):
+    grid = load_script("grid spatial index.py")
+    with pytest.raises(ValueError):
+        grid.GridIndex([(0, 0, 1, 1)], cell_size, bounds)
+
+
+def test_far_item_goes_to_overflow(load_script):
+    grid = load_script("grid spatial index.py")
+    boxes = [(0, 0, 1, 1), (5e6, 5e6, 5e6 + 1, 5e6 + 1)]
+    index = grid.GridIndex(boxes, 10, (0, 0, 100, 100))
+    assert index.overflow.tolist() == [1]
+    assert index.query((4e6, 4e6, 6e6, 6e6)).tolist() == [1]
+    assert index.query((0, 0, 5, 5)).tolist() == [0]
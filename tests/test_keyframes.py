@@ -0,0 +1,21 @@
+import numpy as np
+
+
+def test_unsorted_keyframes_are_sorted(load_script):
+    animation = load_script("keyframe animation.py")
+    timeline = animation.Timeline([[2, 0]], [[[10, 0], [0, 0]]], [[0, 0]], [[[1, 1], [1, 1]]])
+    assert np.allclose(timeline.evaluate(1)[0, :2, 2], (5, 0))
+
+
+def test_interior_padding(load_script):
+    animation = load_script("keyframe animation.py")
+    timeline = animation.Timeline([[0, np.nan, 2]], [[[0, 0], [99, 99], [10, 0]]],
+                                  [[0, 0, 0]], np.ones((1, 3, 2)))
+    assert np.allclose(timeline.evaluate(1)[0, :2, 2], (5, 0))
+
+
+def test_omitted_channel_holds_its_value(load_script):
+    animation = load_script("keyframe animation.py")
+    timeline = animation.Timeline.from_keyframes(
+        [[{'time': 0, 'translate': (100, 0)}, {'time': 1, 'angle': 90}]])
+    assert np.allclose(timeline.evaluate(1)[0], [[0, -1, 100], [1, 0, 0], [0, 0, 1]])
@@ -0,0 +1,18 @@
+import numpy as np
+
+
+def test_draw_lines_in_chunks_matches_one_pass(load_script):
+    from canvas import Framebuffer
+    lines = load_script("bresenham line drawing.py")
+    rng = np.random.default_rng(0)
+    start = rng.integers(-100, 100, (2000, 2))
+    segments = np.hstack((start, start + rng.integers(-60, 60, start.shape)))
+
+    chunks = list(lines.segment_chunks(segments, max_pixels=500))
+    assert np.array_equal(np.concatenate(chunks), segments)
+    for spans in (False, True):
+        whole = Framebuffer(320, 320, origin=(160, 160))
+        whole.put_pixels(*lines.line_pixels(segments), "black")
+        chunked = Framebuffer(320, 320, origin=(160, 160))
+        lines.draw_lines(segments, chunked, spans=spans, max_pixels=500)
+        assert np.array_equal(whole.pixels, chunked.pixels)
@@ -1,12 +1,20 @@
 import turtle
 import math
 
-# Set up enhanced screen
-screen = turtle.Screen()
-screen.bgcolor("white")  # Dark background
-screen.title("2D Geometric Transformations - Translation, Rotation, Scaling")
-screen.setup(width=1200, height=800)
-screen.setworldcoordinates(-600, -400, 600, 400)
+import numpy as np
+
+# The screen is created by setup_screen(), so the transformations can be
+# used without a display
+screen = None
+
+def setup_screen():
+    """Set up enhanced screen"""
+    global screen
+    screen = turtle.Screen()
+    screen.bgcolor("white")  # Dark background
+    screen.title("2D Geometric Transformations - Translation, Rotation, Scaling")
+    screen.setup(width=1200, height=800)
+    screen.setworldcoordinates(-600, -400, 600, 400)
 
 def setup_turtle():
     """Setup turtle with optimized settings"""
@@ -128,24 +136,172 @@ def add_operation_label(x, y, title, description, color):
     turtle.write(description, align="center", font=("Arial", 11, "normal"))
 
 # -------------------- Transformations --------------------
+class Transform:
+    """2D transformation stored as one 3x3 homogeneous matrix
+
+    Operations chain left to right and are composed into the matrix as
+    they are added, so any sequence costs a single matrix product per
+    point when applied:
+
+        Transform().scale(2, 1.5, pivot=(10, 0)).rotate(60).translate(120, 80)
+    """
+
+    def __init__(self, matrix=None):
+        self.matrix = np.eye(3) if matrix is None else np.array(matrix, dtype=np.float64)
+
+    def then(self, other):
+        """Transform applying self first, then other"""
+        return Transform(other.matrix @ self.matrix)
+
+    def translate(self, tx, ty):
+        """Follow with a translation by (tx, ty)"""
+        return self.then(Transform([[1, 0, tx], [0, 1, ty], [0, 0, 1]]))
+
+    def rotate(self, angle, pivot=(0, 0)):
+        """Follow with a rotation by angle degrees about pivot"""
+        rad = math.radians(angle)
+        c = math.cos(rad)
+        s = math.sin(rad)
+        px, py = pivot
+        # Rotation about the pivot: move it to the origin, rotate, move back
+        return self.then(Transform([[c, -s, px - c * px + s * py],
+                                    [s, c, py - s * px - c * py],
+                                    [0, 0, 1]]))
+
+    def scale(self, sx, sy, pivot=(0, 0)):
+        """Follow with a scaling by (sx, sy) about pivot"""
+        px, py = pivot
+        return self.then(Transform([[sx, 0, px - sx * px],
+                                    [0, sy, py - sy * py],
+                                    [0, 0, 1]]))
+
+    def apply(self, points):
+        """Return the (N, 2) points transformed, as a new float64 array"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return points @ self.matrix[:2, :2].T + self.matrix[:2, 2]
+
+    def apply_inplace(self, points, block=65536):
+        """Transform an (N, 2) float array in place, block by block
+
+        Works on float32 buffers too; only one block of temporary memory
+        is used however many points there are. Integer buffers raise
+        TypeError, since the matrix cannot be applied to them in place.
+        """
+        if not np.issubdtype(points.dtype, np.floating):
+            raise TypeError(f"apply_inplace needs a float array, got {points.dtype}")
+        linear = self.matrix[:2, :2].T.astype(points.dtype)
+        offset = self.matrix[:2, 2].astype(points.dtype)
+        for start in range(0, len(points), block):
+            chunk = points[start:start + block]
+            chunk[:] = chunk @ linear + offset
+        return points
+
+class SceneNode:
+    """Node of a scene graph: a local Transform, optional geometry, children
+
+    Each node caches its world matrix (parent's world matrix times its
+    local one) and its geometry in world coordinates. Changing a node's
+    transform only flags it dirty and registers it with the root; the
+    root's update() then recomputes just the flagged subtrees, so static
+    parts of the scene cost nothing per frame.
+    """
+
+    def __init__(self, geometry=None, transform=None):
+        self.local = transform if transform is not None else Transform()
+        self.geometry = (None if geometry is None
+                         else np.asarray(geometry, dtype=np.float64).reshape(-1, 2))
+        self.parent = None
+        self.children = []
+        self.world = np.eye(3)
+        self.vertices = self.geometry
+        self.dirty = True
+        self.pending = {self}  # Dirty subtrees, kept on the root only
+
+    def root(self):
+        """The topmost ancestor of this node"""
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    def depth(self):
+        """Number of ancestors of this node"""
+        depth = 0
+        node = self.parent
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
+
+    def add(self, child):
+        """Attach a root node (and its subtree) as a child; returns the child"""
+        if child.parent is not None:
+            raise ValueError("node already has a parent")
+        child.parent = self
+        self.children.append(child)
+        root = self.root()
+        root.pending |= child.pending | {child}
+        child.pending = set()
+        child.dirty = True
+        return child
+
+    def set_transform(self, transform):
+        """Replace the local transform and flag the subtree for recomputation"""
+        self.local = transform
+        if not self.dirty:
+            self.dirty = True
+            self.root().pending.add(self)
+
+    def update(self):
+        """Recompute the dirty subtrees of this (root) node
+
+        Returns the number of nodes whose world data was recomputed.
+        """
+        count = 0
+        # Parents first, so a dirty child inside a dirty subtree is done once
+        for node in sorted(self.pending, key=SceneNode.depth):
+            if node.dirty:
+                count += node._recompute()
+        self.pending = set()
+        return count
+
+    def _recompute(self):
+        """Recompute world matrices and vertices of this whole subtree"""
+        count = 0
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            parent_world = node.parent.world if node.parent is not None else np.eye(3)
+            node.world = parent_world @ node.local.matrix
+            if node.geometry is not None:
+                node.vertices = Transform(node.world).apply(node.geometry)
+            node.dirty = False
+            count += 1
+            stack.extend(node.children)
+        return count
+
+    def walk(self):
+        """Yield this node and all its descendants, parents first"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
 def translate(points, tx, ty):
     """Translate polygon by (tx, ty)"""
-    return [(x + tx, y + ty) for x, y in points]
+    return [tuple(p) for p in Transform().translate(tx, ty).apply(points).tolist()]
 
 def rotate(points, angle):
     """Rotate polygon about origin"""
-    rad = math.radians(angle)
-    return [
-        (x*math.cos(rad) - y*math.sin(rad),
-         x*math.sin(rad) + y*math.cos(rad))
-        for x, y in points
-    ]
+    return [tuple(p) for p in Transform().rotate(angle).apply(points).tolist()]
 
 def scale(points, sx, sy):
     """Scale polygon about origin"""
-    return [(x*sx, y*sy) for x, y in points]
+    return [tuple(p) for p in Transform().scale(sx, sy).apply(points).tolist()]
 
 def main():
+    setup_screen()
     setup_turtle()
     add_title()
     draw_axes()